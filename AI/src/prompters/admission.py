@@ -0,0 +1,267 @@
+"""시뮬레이션 요청 수락 제어 (Admission Control).
+
+- 클라이언트별 토큰 버킷 레이트 리미팅
+- 동일 입력에 대한 진행 중 요청 병합 (single-flight)
+- 우선순위 클래스를 갖는 동시 실행 수 제한
+"""
+
+import asyncio
+import heapq
+import ipaddress
+import itertools
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from .enums import RequestPriority
+
+
+class AdmissionRejected(Exception):
+    """요청이 수락되지 않았을 때 발생하는 예외."""
+
+    def __init__(self, status_code: int, detail: str, retry_after: float):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Retry-After 헤더 (정수 초, 최소 1초)."""
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(value: str) -> List[Network]:
+    """
+    "10.0.0.1,10.1.0.0/16" 형식의 신뢰 프록시 목록을 파싱합니다.
+
+    Raises:
+        ValueError: 주소 형식이 잘못된 경우
+    """
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def resolve_client_ip(
+    peer: Optional[str], forwarded_for: Optional[str], trusted: List[Network]
+) -> str:
+    """
+    레이트 리미팅에 사용할 클라이언트 주소를 결정합니다.
+
+    X-Forwarded-For는 직접 연결한 상대(peer)가 신뢰 프록시일 때만 사용하며,
+    오른쪽(가장 가까운 프록시)부터 신뢰 프록시를 건너뛰고 처음 만나는 주소를 클라이언트로 봅니다.
+    헤더의 왼쪽 값은 클라이언트가 임의로 넣을 수 있으므로 그대로 신뢰하지 않습니다.
+    """
+    def is_trusted(address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in trusted)
+
+    if peer is None:
+        return "unknown"
+    if not forwarded_for or not is_trusted(peer):
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, rate: float, capacity: float, now: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic() if now is None else now
+
+    def try_acquire(self, now: Optional[float] = None) -> Tuple[bool, float]:
+        """
+        토큰 1개를 소비합니다.
+
+        Returns:
+            (성공 여부, 다음 토큰까지 대기해야 하는 시간(초))
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True, 0.0
+        return False, (1.0 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """클라이언트별 토큰 버킷 레이트 리미터."""
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def check(self, client_id: str) -> None:
+        """
+        클라이언트 요청을 허용할지 검사합니다.
+
+        Raises:
+            AdmissionRejected: 허용량을 초과한 경우 (429)
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.burst, now)
+            self._buckets[client_id] = bucket
+            # 오래 사용되지 않은 클라이언트부터 제거
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client_id)
+
+        allowed, retry_after = bucket.try_acquire(now)
+        if not allowed:
+            raise AdmissionRejected(
+                429, "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.", retry_after
+            )
+
+
+class SingleFlight:
+    """동일 키로 진행 중인 작업을 하나로 병합합니다."""
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+    @property
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key에 해당하는 작업이 진행 중이면 그 결과를 기다리고,
+        없으면 fn을 별도 태스크로 실행하여 결과를 대기 중인 모든 요청과 공유합니다.
+
+        작업은 어느 요청에도 속하지 않으므로, 먼저 온 요청이 취소되어도
+        나머지 요청은 결과를 그대로 받습니다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        # 요청 하나의 취소가 공유 작업에 전파되지 않도록 shield
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 대기자가 모두 취소되어도 "exception was never retrieved" 경고가 나지 않도록
+            task.exception()
+
+
+class AdmissionController:
+    """
+    동시 실행 수를 제한하는 우선순위 기반 수락 제어기.
+
+    슬롯이 없으면 우선순위 큐에서 대기하며, 큐가 가득 찼거나
+    대기 시간이 queue_timeout을 넘으면 즉시 503으로 거절합니다.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._running = 0
+        self._waiters: List[Tuple[int, int, "asyncio.Future[None]"]] = []
+        self._counter = itertools.count()
+        # 최근 실행 시간 이동 평균 (Retry-After 추정용)
+        self._avg_runtime = 0.1
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def _estimate_retry_after(self) -> float:
+        backlog = self.queued + 1
+        return self._avg_runtime * backlog / max(1, self.max_concurrent)
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """
+        실행 슬롯을 획득합니다.
+
+        Raises:
+            AdmissionRejected: 큐가 가득 찼거나 대기 시간을 초과한 경우 (503)
+        """
+        if self._running < self.max_concurrent and not self.queued:
+            self._running += 1
+            return
+
+        # 비용이 큰 요청은 큐의 절반까지만 사용할 수 있음
+        queue_limit = self.max_queued
+        if priority == RequestPriority.BATCH:
+            queue_limit = self.max_queued // 2
+        if self.queued >= queue_limit:
+            raise AdmissionRejected(
+                503, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", self._estimate_retry_after()
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority.rank, next(self._counter), future))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # 타임아웃 직전에 슬롯을 넘겨받은 경우 반환
+                self.release()
+            future.cancel()
+            raise AdmissionRejected(
+                503, "대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+                self._estimate_retry_after(),
+            )
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release()
+            future.cancel()
+            raise
+
+    def release(self) -> None:
+        """슬롯을 반환하고 가장 우선순위가 높은 대기자에게 넘깁니다."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # 슬롯을 그대로 넘기므로 _running은 변하지 않음
+                future.set_result(None)
+                return
+        self._running -= 1
+
+    def record_runtime(self, seconds: float) -> None:
+        self._avg_runtime = 0.8 * self._avg_runtime + 0.2 * seconds
+
+    async def run(self, priority: RequestPriority, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """슬롯을 획득한 뒤 fn을 실행합니다."""
+        await self.acquire(priority)
+        started = time.perf_counter()
+        try:
+            return await fn()
+        finally:
+            self.record_runtime(time.perf_counter() - started)
+            self.release()
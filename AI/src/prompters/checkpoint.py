@@ -0,0 +1,80 @@
+"""시뮬레이션 단계별 체크포인트 캐시.
+
+상위 단계(캐시 계층 적중/미스, 수율 샘플)의 결과를 해당 단계가 의존하는
+입력 필드의 해시로 저장해 두고, 하위 파라미터(메모리 지연, MTTR/MTBF 등)만
+바뀐 요청에서는 저장된 결과를 재사용하여 나머지 단계만 다시 계산합니다.
+
+시뮬레이션은 스레드 풀에서 실행되므로 캐시 조작은 잠금으로 보호합니다.
+(계산 자체는 잠금 밖에서 수행하므로 같은 키가 동시에 두 번 계산될 수 있음)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+def config_hash(model: BaseModel, include: Any) -> str:
+    """
+    모델에서 include로 지정한 필드만 직렬화하여 해시를 계산합니다.
+
+    Args:
+        model: 입력 모델
+        include: Pydantic model_dump의 include 인자 (set 또는 중첩 dict)
+    """
+    payload = model.model_dump_json(include=include)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class StageCache(Generic[T]):
+    """단계 결과를 저장하는 LRU 캐시."""
+
+    def __init__(self, name: str, maxsize: int = 4096):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[T]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: T) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """저장된 결과가 있으면 반환하고, 없으면 계산하여 저장합니다."""
+        value = self.get(key)
+        with self._lock:
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,89 @@
+"""시나리오 비교: 기준안 대비 지표 변화와 순위 계산."""
+
+from typing import Dict, List, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from .enums import SimulatorType
+from .schemas import MetricDelta, MetricRanking, ScenarioResult
+
+# 비교 지표와 방향 (True = 클수록 좋음)
+CPU_METRICS: Dict[str, bool] = {
+    "ipc": True,
+    "total_execution_time": False,
+    "stall_rate": False,
+    "l1_hit_rate": True,
+    "l2_hit_rate": True,
+    "amat": False,
+    "mpi": False,
+    "bus_congestion": False,
+    "total_energy": False,
+    "edp": False,
+}
+
+FAB_METRICS: Dict[str, bool] = {
+    "parametric_yield": True,
+    "functional_yield": True,
+    "oee": True,
+    "wip_level": False,
+    "mask_amortization_cost": False,
+    "line_balance_efficiency": True,
+}
+
+
+def scenario_name(index: int) -> str:
+    return "기준안" if index == 0 else f"변형안 {index}"
+
+
+def metric_directions(simulator_type: SimulatorType) -> Dict[str, bool]:
+    if simulator_type == SimulatorType.CPU_ARCHITECTURE:
+        return CPU_METRICS
+    return FAB_METRICS
+
+
+def compare_outputs(
+    simulator_type: SimulatorType, outputs: Sequence[BaseModel]
+) -> Tuple[List[ScenarioResult], List[MetricRanking]]:
+    """
+    outputs[0]을 기준안으로 하여 각 시나리오의 지표 변화와 지표별 순위를 계산합니다.
+
+    Returns:
+        (시나리오 결과 목록, 지표별 순위 목록)
+    """
+    directions = metric_directions(simulator_type)
+    values = [
+        {metric: float(getattr(output, metric)) for metric in directions}
+        for output in outputs
+    ]
+    baseline = values[0]
+
+    scenarios = []
+    for index, (output, row) in enumerate(zip(outputs, values)):
+        deltas = {}
+        for metric, value in row.items():
+            base = baseline[metric]
+            deltas[metric] = MetricDelta(
+                value=value,
+                delta=value - base,
+                delta_percent=(value - base) / abs(base) * 100 if base else None,
+            )
+        result = ScenarioResult(index=index, name=scenario_name(index), deltas=deltas)
+        if simulator_type == SimulatorType.CPU_ARCHITECTURE:
+            result.cpu_output = output
+        else:
+            result.fab_output = output
+        scenarios.append(result)
+
+    rankings = [
+        MetricRanking(
+            metric=metric,
+            higher_is_better=higher_is_better,
+            # 동률이면 인덱스가 작은 시나리오(기준안)가 앞
+            ranking=sorted(
+                range(len(values)),
+                key=lambda i: (-values[i][metric] if higher_is_better else values[i][metric], i),
+            ),
+        )
+        for metric, higher_is_better in directions.items()
+    ]
+    return scenarios, rankings
@@ -0,0 +1,421 @@
+"""다중 노드 분산 스윕 실행 (코디네이터 / 워커).
+
+코디네이터는 CPUArchitectureInput 스윕을 작업 단위(work unit)로 나누어
+TCP로 연결된 워커들에게 보내고, 완료되는 순서대로 결과를 스트리밍합니다.
+
+프로토콜: 한 줄에 JSON 객체 하나 (newline-delimited JSON)
+    인사: {"token": str | null} -> {"ready": true} 또는 {"error": str} (이후 연결 종료)
+    요청: {"unit_id": int, "inputs": [CPUArchitectureInput, ...]}
+    응답: {"unit_id": int, "outputs": [CPUArchitectureOutput, ...]}
+          또는 {"unit_id": int, "error": str}
+
+- 작업 분배는 풀(pull) 방식이라 빠른 워커가 더 많은 단위를 가져갑니다.
+- 대기 중인 단위가 없으면 유휴 워커가 다른 워커에서 실행 중인 단위를 중복 실행합니다 (work stealing).
+- 워커 연결이 끊기면 실행 중이던 단위는 다시 대기열로 돌아갑니다.
+- 응답 시간을 넘기면 단위를 대기열로 되돌리고(시도 횟수에 포함) 같은 워커에 다시 연결합니다.
+- 워커가 오류로 응답한 단위(잘못된 입력, 시뮬레이션 오류)는 재시도하지 않고 스윕을 실패시킵니다.
+
+워커에는 인증 외의 보호 장치가 없으므로 루프백 또는 사설 네트워크 주소에만 바인딩해야 합니다.
+루프백이 아닌 주소로 실행하려면 공유 비밀(SWEEP_WORKER_TOKEN)이 필요하며,
+코디네이터는 같은 값을 인사 메시지로 보냅니다.
+
+로컬 워커 실행 (src 디렉토리에서):
+    python -m prompters.distributed worker --port 9101
+"""
+
+import argparse
+import asyncio
+import functools
+import hmac
+import ipaddress
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from settings import settings
+
+from .evaluation import SimulatorEngine
+from .schemas import CPUArchitectureInput, CPUArchitectureOutput
+from .validation import validate_cpu_rows
+
+# 한 줄(메시지)의 최대 길이
+STREAM_LIMIT = 64 * 1024 * 1024
+
+Address = Tuple[str, int]
+
+
+class SweepError(Exception):
+    """분산 스윕을 완료할 수 없을 때 발생하는 예외."""
+    pass
+
+
+class SweepUnitError(SweepError):
+    """워커가 작업 단위 실행 중 오류를 보고했을 때 발생하는 예외 (재시도해도 같은 결과)."""
+
+    def __init__(self, unit_id: int, start: int, error: str):
+        self.unit_id = unit_id
+        self.start = start
+        self.error = error
+        super().__init__(f"작업 단위 {unit_id} (행 {start}부터) 실패: {error}")
+
+
+def parse_worker_addresses(value: str) -> List[Address]:
+    """'host:port,host:port' 형식의 문자열을 주소 목록으로 변환합니다."""
+    addresses = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.rpartition(":")
+        addresses.append((host or "127.0.0.1", int(port)))
+    return addresses
+
+
+async def _write_message(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Optional[dict]:
+    line = await reader.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+# ==================== 워커 ====================
+
+
+def _token_matches(presented: object, token: str) -> bool:
+    if not isinstance(presented, str):
+        return False
+    return hmac.compare_digest(presented.encode("utf-8"), token.encode("utf-8"))
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, token: Optional[str] = None
+) -> None:
+    """코디네이터 연결 하나를 처리합니다. token이 있으면 인사 메시지의 토큰이 일치해야 합니다."""
+    try:
+        hello = await _read_message(reader)
+        if not isinstance(hello, dict):
+            return
+        if token is not None and not _token_matches(hello.get("token"), token):
+            await _write_message(writer, {"error": "워커 인증에 실패했습니다."})
+            return
+        await _write_message(writer, {"ready": True})
+
+        while True:
+            message = await _read_message(reader)
+            if message is None:
+                break
+            unit_id = message.get("unit_id")
+            try:
+                inputs = validate_cpu_rows(message["inputs"])
+                outputs = await SimulatorEngine.run_cpu_sweep(inputs)
+                reply = {
+                    "unit_id": unit_id,
+                    "outputs": [output.model_dump(mode="json") for output in outputs],
+                }
+            except Exception as e:
+                # 연결을 유지한 채 오류를 보고해야 코디네이터가 워커 손실로 오인하지 않음
+                reply = {"unit_id": unit_id, "error": f"{type(e).__name__}: {e}"}
+            await _write_message(writer, reply)
+    except (ConnectionError, asyncio.IncompleteReadError, json.JSONDecodeError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_worker(host: str = "127.0.0.1", port: int = 0, token: Optional[str] = None) -> None:
+    """워커 서버를 실행합니다. 준비되면 'READY <port>'를 표준 출력에 씁니다."""
+    server = await asyncio.start_server(
+        functools.partial(_handle_connection, token=token), host, port, limit=STREAM_LIMIT
+    )
+    bound_port = server.sockets[0].getsockname()[1]
+    print(f"READY {bound_port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class LocalWorker:
+    """같은 머신에서 실행되는 워커 프로세스 (테스트/검증용)."""
+
+    def __init__(self, process: asyncio.subprocess.Process, address: Address):
+        self.process = process
+        self.address = address
+
+    def kill(self) -> None:
+        if self.process.returncode is None:
+            self.process.kill()
+
+    async def wait(self) -> None:
+        await self.process.wait()
+
+
+async def spawn_local_workers(
+    count: int, host: str = "127.0.0.1", token: Optional[str] = None
+) -> List[LocalWorker]:
+    """로컬 워커 프로세스 count개를 띄우고 준비될 때까지 기다립니다."""
+    # prompters 패키지를 찾을 수 있도록 src 디렉토리에서 실행
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # 토큰은 프로세스 목록에 노출되지 않도록 명령행 대신 환경 변수로 전달
+    env = dict(os.environ)
+    if token is not None:
+        env["SWEEP_WORKER_TOKEN"] = token
+    else:
+        env.pop("SWEEP_WORKER_TOKEN", None)
+    workers = []
+    for _ in range(count):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "prompters.distributed", "worker",
+            "--host", host, "--port", "0",
+            stdout=asyncio.subprocess.PIPE,
+            cwd=src_dir,
+            env=env,
+        )
+        line = (await process.stdout.readline()).decode().strip()
+        if not line.startswith("READY "):
+            process.kill()
+            raise SweepError(f"워커 프로세스를 시작하지 못했습니다: {line!r}")
+        workers.append(LocalWorker(process, (host, int(line.split()[1]))))
+    return workers
+
+
+# ==================== 코디네이터 ====================
+
+
+@dataclass
+class _WorkUnit:
+    unit_id: int
+    start: int
+    payload: List[dict]
+    attempts: int = 0
+    running: Set[int] = field(default_factory=set)  # 실행 중인 워커 인덱스
+    done: bool = False
+
+
+class SweepCoordinator:
+    """
+    스윕을 작업 단위로 나누어 워커들에게 분배하는 코디네이터.
+
+    Args:
+        workers: 워커 주소 목록
+        unit_size: 작업 단위당 행 수
+        max_attempts: 단위당 최대 시도 횟수 (워커 손실 시 재시도)
+        unit_timeout: 단위 하나의 응답 대기 시간 (초). 초과하면 단위를 재시도하고 워커에 다시 연결
+        steal: 대기 중인 단위가 없을 때 다른 워커의 단위를 중복 실행할지 여부
+        token: 워커 인증용 공유 비밀 (워커의 SWEEP_WORKER_TOKEN과 같아야 함)
+    """
+
+    def __init__(
+        self,
+        workers: Sequence[Address],
+        unit_size: int = 64,
+        max_attempts: int = 3,
+        unit_timeout: float = 60.0,
+        steal: bool = True,
+        token: Optional[str] = None,
+    ):
+        if not workers:
+            raise ValueError("워커 주소가 하나 이상 필요합니다.")
+        self.workers = list(workers)
+        self.unit_size = unit_size
+        self.max_attempts = max_attempts
+        self.unit_timeout = unit_timeout
+        self.steal = steal
+        self.token = token
+
+    async def _connect(
+        self, address: Address
+    ) -> Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+        """워커에 연결하고 인사를 주고받습니다. 연결 또는 인증에 실패하면 None을 반환합니다."""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(*address, limit=STREAM_LIMIT), timeout=self.unit_timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        ready = False
+        try:
+            await _write_message(writer, {"token": self.token})
+            reply = await asyncio.wait_for(_read_message(reader), timeout=self.unit_timeout)
+            ready = isinstance(reply, dict) and reply.get("ready") is True
+        except (OSError, asyncio.TimeoutError, json.JSONDecodeError):
+            pass
+        finally:
+            if not ready:
+                writer.close()
+        return (reader, writer) if ready else None
+
+    async def stream(
+        self, inputs: Sequence[CPUArchitectureInput]
+    ) -> AsyncIterator[Tuple[int, CPUArchitectureOutput]]:
+        """
+        스윕을 실행하고 (입력 인덱스, 결과)를 완료되는 순서대로 반환합니다.
+
+        Raises:
+            SweepUnitError: 워커가 단위 실행 오류를 보고한 경우
+            SweepError: 모든 워커를 잃었거나 단위가 최대 시도 횟수를 넘긴 경우
+        """
+        units = [
+            _WorkUnit(
+                unit_id=i,
+                start=start,
+                payload=[p.model_dump(mode="json") for p in inputs[start:start + self.unit_size]],
+            )
+            for i, start in enumerate(range(0, len(inputs), self.unit_size))
+        ]
+        if not units:
+            return
+
+        pending: List[int] = [unit.unit_id for unit in units]
+        # (단위, 결과, 워커가 보고한 오류, 코디네이터 측 실패 사유)
+        results: "asyncio.Queue[Tuple[_WorkUnit, Optional[list], Optional[str], Optional[str]]]" = (
+            asyncio.Queue()
+        )
+        state = asyncio.Condition()
+        remaining = len(units)
+        # 스윕이 끝나거나 중단되면 True. 취소만으로는 부족함: Python 3.11 이하의
+        # asyncio.wait_for는 응답과 취소가 겹치면 취소를 삼킬 수 있음
+        closing = False
+
+        def pick(worker_index: int) -> Optional[_WorkUnit]:
+            if pending:
+                return units[pending.pop(0)]
+            if not self.steal:
+                return None
+            # 다른 워커가 실행 중인 미완료 단위 중 복제본이 가장 적은 것
+            candidates = [
+                u for u in units
+                if not u.done and u.running and worker_index not in u.running and len(u.running) < 2
+            ]
+            return min(candidates, key=lambda u: len(u.running)) if candidates else None
+
+        async def requeue(unit: _WorkUnit, worker_index: int) -> None:
+            """실패한 시도를 되돌립니다. 다른 워커가 실행 중이 아니면 시도 횟수에 포함합니다."""
+            async with state:
+                unit.running.discard(worker_index)
+                if not unit.done and not unit.running:
+                    unit.attempts += 1
+                    if unit.attempts >= self.max_attempts:
+                        unit.done = True
+                        await results.put((unit, None, None, "최대 재시도 횟수를 초과했습니다."))
+                    else:
+                        pending.insert(0, unit.unit_id)
+                state.notify_all()
+
+        async def drive(worker_index: int, address: Address) -> None:
+            connection = await self._connect(address)
+            while connection is not None:
+                reader, writer = connection
+                unit: Optional[_WorkUnit] = None
+                try:
+                    while True:
+                        async with state:
+                            unit = None
+                            while remaining and not closing and unit is None:
+                                unit = pick(worker_index)
+                                if unit is None:
+                                    await state.wait()
+                            if unit is None:
+                                return
+                            unit.running.add(worker_index)
+
+                        await _write_message(writer, {"unit_id": unit.unit_id, "inputs": unit.payload})
+                        reply = await asyncio.wait_for(_read_message(reader), timeout=self.unit_timeout)
+                        if reply is None:
+                            raise ConnectionError("워커 연결이 종료되었습니다.")
+
+                        async with state:
+                            unit.running.discard(worker_index)
+                            if not unit.done:
+                                unit.done = True
+                                await results.put((unit, reply.get("outputs"), reply.get("error"), None))
+                            unit = None
+                            state.notify_all()
+                except asyncio.TimeoutError:
+                    # 응답 지연: 단위를 되돌리고 새 연결로 계속 (늦은 응답이 섞이지 않도록 연결을 교체)
+                    if unit is not None:
+                        await requeue(unit, worker_index)
+                except (OSError, ConnectionError, json.JSONDecodeError):
+                    # 워커 손실: 실행 중이던 단위를 되돌리고 이 워커는 더 사용하지 않음
+                    if unit is not None:
+                        await requeue(unit, worker_index)
+                    return
+                finally:
+                    writer.close()
+                if closing:
+                    return
+                connection = await self._connect(address)
+
+        tasks = [
+            asyncio.create_task(drive(i, address)) for i, address in enumerate(self.workers)
+        ]
+        try:
+            while remaining:
+                alive = [t for t in tasks if not t.done()]
+                if not alive and results.empty():
+                    raise SweepError("사용 가능한 워커가 없어 스윕을 완료할 수 없습니다.")
+                get = asyncio.create_task(results.get())
+                done, _ = await asyncio.wait([get, *alive], return_when=asyncio.FIRST_COMPLETED)
+                if get not in done:
+                    get.cancel()
+                    continue
+
+                unit, outputs, error, failure = get.result()
+                if error is not None:
+                    raise SweepUnitError(unit.unit_id, unit.start, error)
+                if failure is not None:
+                    raise SweepError(f"작업 단위 {unit.unit_id} 실패: {failure}")
+                async with state:
+                    remaining -= 1
+                    state.notify_all()
+                for offset, row in enumerate(outputs):
+                    yield unit.start + offset, CPUArchitectureOutput.model_validate(row)
+        finally:
+            closing = True
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, inputs: Sequence[CPUArchitectureInput]) -> List[CPUArchitectureOutput]:
+        """스윕을 실행하고 입력 순서대로 정렬된 결과를 반환합니다."""
+        outputs: Dict[int, CPUArchitectureOutput] = {}
+        async for index, output in self.stream(inputs):
+            outputs[index] = output
+        return [outputs[i] for i in range(len(inputs))]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="분산 스윕 워커")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    worker = subparsers.add_parser("worker", help="워커 서버 실행")
+    worker.add_argument("--host", default="127.0.0.1", help="바인딩 주소 (루프백 또는 사설 네트워크)")
+    worker.add_argument("--port", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        # 토큰은 명령행 인자 대신 환경 변수(SWEEP_WORKER_TOKEN) 또는 .env로만 받음
+        token = settings.sweep_worker_token
+        if token is None and not _is_loopback(args.host):
+            parser.error("루프백이 아닌 주소로 실행하려면 SWEEP_WORKER_TOKEN을 설정해야 합니다.")
+        try:
+            asyncio.run(serve_worker(args.host, args.port, token))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
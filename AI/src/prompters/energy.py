@@ -0,0 +1,181 @@
+"""활동 기반 전력/에너지 모델 (McPAT-lite).
+
+시뮬레이터가 산출한 이벤트 횟수(명령어 수, 캐시 레벨별 접근 수, DRAM 접근 수)에
+구성별 접근당 에너지를 곱하고, 실행 시간 동안의 누설 에너지를 더해 총 에너지를 계산합니다.
+구성별 계수는 캐시되므로 스윕 배치에서는 곱셈-누적만 수행합니다.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from .schemas import CacheConfig, CPUArchitectureInput, EnergyBreakdown
+
+
+# ==================== 모델 상수 ====================
+
+# 캐시 접근당 동적 에너지 기준값 (pJ, 1KB 직접 사상 / 64B 블록 기준)
+CACHE_ACCESS_PJ_PER_SQRT_KB = 3.5
+# 연관도(way) 당 태그 비교/데이터 읽기 추가 비율
+CACHE_WAY_FACTOR = 0.05
+# 캐시 누설 전력 (W / byte)
+CACHE_LEAKAGE_W_PER_BYTE = 1.2e-7
+
+# 코어 명령어당 동적 에너지 기준값 (pJ, issue 4 / ROB 128 / 10단 파이프라인, 3.2GHz 기준)
+CORE_INSTRUCTION_PJ = 60.0
+# 코어당 누설 전력 기준값 (W)
+CORE_LEAKAGE_W = 0.5
+REFERENCE_FREQUENCY_GHZ = 3.2
+
+# DRAM 64B 접근당 에너지 (pJ)
+DRAM_ACCESS_PJ = 15_000.0
+# 오프칩 버스 전송 에너지 (pJ / byte)
+BUS_PJ_PER_BYTE = 40.0
+
+PJ = 1e-12
+
+
+# ==================== 활동 횟수 ====================
+
+
+@dataclass(frozen=True)
+class ActivityCounts:
+    """시뮬레이션에서 집계된 이벤트 횟수."""
+    instructions: float
+    execution_time: float  # Seconds
+    l1_accesses: float
+    l2_accesses: float
+    l3_accesses: float
+    dram_accesses: float
+
+
+# ==================== 구성별 계수 ====================
+
+
+@lru_cache(maxsize=1024)
+def cache_access_energy(size_bytes: int, associativity: int, block_size: int) -> float:
+    """캐시 접근 1회당 동적 에너지 (J)."""
+    size_kb = size_bytes / 1024
+    pj = (
+        CACHE_ACCESS_PJ_PER_SQRT_KB
+        * math.sqrt(size_kb)
+        * (1 + CACHE_WAY_FACTOR * associativity)
+        * (block_size / 64)
+    )
+    return pj * PJ
+
+
+@lru_cache(maxsize=1024)
+def core_instruction_energy(
+    issue_width: int, rob_size: int, pipeline_depth: int, clock_frequency: float
+) -> float:
+    """명령어 1개당 코어 동적 에너지 (J)."""
+    # 발행 폭/ROB가 커질수록 wakeup-select, 레지스터 파일 포트가 늘어남
+    width_factor = math.sqrt(issue_width / 4)
+    rob_factor = (rob_size / 128) ** 0.3
+    # 파이프라인이 깊어질수록 래치 에너지 증가
+    depth_factor = math.sqrt(pipeline_depth / 10)
+    # DVFS: 전압이 주파수에 비례한다고 가정하여 E ∝ V²
+    voltage_factor = (0.6 + 0.4 * clock_frequency / REFERENCE_FREQUENCY_GHZ) ** 2
+    return CORE_INSTRUCTION_PJ * width_factor * rob_factor * depth_factor * voltage_factor * PJ
+
+
+@dataclass(frozen=True)
+class EnergyCoefficients:
+    """구성별 에너지 계수 (활동 횟수와 무관)."""
+    core_per_instruction: float  # J
+    l1_per_access: float  # J
+    l2_per_access: float  # J
+    l3_per_access: float  # J
+    dram_per_access: float  # J (버스 전송 제외)
+    bus_per_access: float  # J
+    leakage_power: float  # W
+
+
+def _cache_key(config: Optional[CacheConfig]) -> Optional[Tuple[int, int, int]]:
+    if config is None:
+        return None
+    normalized = config.normalized
+    return (normalized.size_bytes, normalized.ways, normalized.block_size)
+
+
+@lru_cache(maxsize=1024)
+def _coefficients(
+    cores: int,
+    issue_width: int,
+    rob_size: int,
+    pipeline_depth: int,
+    clock_frequency: float,
+    l1: Tuple[int, int, int],
+    l2: Tuple[int, int, int],
+    l3: Optional[Tuple[int, int, int]],
+) -> EnergyCoefficients:
+    leakage = cores * CORE_LEAKAGE_W * (issue_width / 4) * (rob_size / 128) ** 0.5
+    # L1/L2는 코어별, L3는 공유
+    leakage += cores * (l1[0] + l2[0]) * CACHE_LEAKAGE_W_PER_BYTE
+    if l3 is not None:
+        leakage += l3[0] * CACHE_LEAKAGE_W_PER_BYTE
+
+    block_size = (l3 or l2)[2]
+    return EnergyCoefficients(
+        core_per_instruction=core_instruction_energy(
+            issue_width, rob_size, pipeline_depth, clock_frequency
+        ),
+        l1_per_access=cache_access_energy(*l1),
+        l2_per_access=cache_access_energy(*l2),
+        l3_per_access=cache_access_energy(*l3) if l3 is not None else 0.0,
+        dram_per_access=DRAM_ACCESS_PJ * (block_size / 64) * PJ,
+        bus_per_access=BUS_PJ_PER_BYTE * block_size * PJ,
+        leakage_power=leakage,
+    )
+
+
+def energy_coefficients(input_params: CPUArchitectureInput) -> EnergyCoefficients:
+    """입력 구성에 대한 에너지 계수를 반환합니다 (캐시됨)."""
+    return _coefficients(
+        input_params.number_of_cores,
+        input_params.issue_width,
+        input_params.rob_size,
+        input_params.pipeline_depth,
+        input_params.clock_frequency,
+        _cache_key(input_params.l1_cache_config),
+        _cache_key(input_params.l2_cache_config),
+        _cache_key(input_params.l3_cache_config),
+    )
+
+
+# ==================== 에너지 계산 ====================
+
+
+def estimate_energy(coeffs: EnergyCoefficients, activity: ActivityCounts) -> EnergyBreakdown:
+    """활동 횟수로부터 에너지 분해 결과를 계산합니다."""
+    cache_dynamic = (
+        activity.l1_accesses * coeffs.l1_per_access
+        + activity.l2_accesses * coeffs.l2_per_access
+        + activity.l3_accesses * coeffs.l3_per_access
+    )
+    return EnergyBreakdown(
+        core_dynamic=activity.instructions * coeffs.core_per_instruction,
+        cache_dynamic=cache_dynamic,
+        dram=activity.dram_accesses * coeffs.dram_per_access,
+        bus=activity.dram_accesses * coeffs.bus_per_access,
+        leakage=activity.execution_time * coeffs.leakage_power,
+    )
+
+
+def estimate_energy_batch(
+    inputs: Sequence[CPUArchitectureInput], activities: Sequence[ActivityCounts]
+) -> List[EnergyBreakdown]:
+    """
+    스윕 배치의 에너지를 한 번에 계산합니다.
+
+    동일한 구성 요소(캐시, 코어)를 공유하는 행은 계수를 재사용하므로
+    행당 비용은 곱셈-누적 몇 번으로 줄어듭니다.
+    """
+    if len(inputs) != len(activities):
+        raise ValueError("입력과 활동 횟수의 개수가 일치하지 않습니다.")
+    return [
+        estimate_energy(energy_coefficients(params), activity)
+        for params, activity in zip(inputs, activities)
+    ]
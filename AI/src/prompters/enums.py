@@ -36,3 +36,14 @@ class LithographySource(str, Enum):
     ARF_IMMERSION = "arf_immersion"
     EUV = "euv"
 
+
+
+class RequestPriority(str, Enum):
+    """시뮬레이션 요청 우선순위 클래스."""
+    INTERACTIVE = "interactive"  # 일반 대화형 요청
+    BATCH = "batch"  # 트레이스 기반 등 비용이 큰 요청
+
+    @property
+    def rank(self) -> int:
+        """큐 정렬 순서 (작을수록 먼저 실행)."""
+        return 0 if self is RequestPriority.INTERACTIVE else 1
@@ -1,114 +1,423 @@
 """시뮬레이터 실행 및 평가 로직."""
 
+import asyncio
 import json
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Optional, Tuple, TypeVar
 from .schemas import (
     CPUArchitectureInput,
     CPUArchitectureOutput,
     SemiconductorFabInput,
     SemiconductorFabOutput,
     BinningDistribution,
+    ConfidenceInterval,
+    EnergyBreakdown,
+    SamplingConfig,
 )
 from .enums import SimulatorType
+from .checkpoint import StageCache, config_hash
+from .energy import ActivityCounts, energy_coefficients, estimate_energy, estimate_energy_batch
+from .sampling import bernoulli_summary, binomial, run_sampling
+from .profiling import tracked
+
+T = TypeVar("T")
+
+
+# 모의 워크로드: 명령어 수와 명령어당 메모리 참조 비율
+WORKLOAD_INSTRUCTIONS = 1e12
+MEMORY_REFS_PER_INSTRUCTION = 0.3
+
+# 캐시 계층 단계가 의존하는 입력 필드 (L3 지연, 메모리 지연 등은 적중/미스에 영향 없음)
+CPU_HIERARCHY_FIELDS = {
+    "l1_cache_config": True,
+    "l2_cache_config": True,
+    "l3_cache_config": {"size", "associativity", "block_size"},
+    "prefetcher_type": True,
+    "trace_file": True,
+}
+
+# 수율 단계가 의존하는 입력 필드 (설비 효율 파라미터는 수율에 영향 없음)
+FAB_YIELD_FIELDS = {
+    "technology_node",
+    "lithography_source",
+    "mask_layer_count",
+    "cpk_target",
+    "cd_uniformity",
+    "overlay_accuracy",
+    "defect_clustering_factor",
+    "killer_defect_ratio",
+}
+
+
+@dataclass(frozen=True)
+class MemoryHierarchyCheckpoint:
+    """캐시 계층 단계 결과 (레벨별 적중률과 접근/미스 횟수)."""
+    l1_hit_rate: float
+    l2_hit_rate: float
+    l3_hit_rate: Optional[float]
+    l1_accesses: float
+    l2_accesses: float
+    l3_accesses: float
+    dram_accesses: float
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = None
+
+
+@dataclass(frozen=True)
+class YieldCheckpoint:
+    """수율 단계 결과."""
+    functional_yield: float
+    parametric_yield: float
+    grade_a: float
+    grade_b: float
+    grade_c: float
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = None
+
+
+_hierarchy_cache: StageCache[MemoryHierarchyCheckpoint] = StageCache("cpu_hierarchy")
+_yield_cache: StageCache[YieldCheckpoint] = StageCache("fab_yield")
+
+
+def _stage_key(input_params: Any, fields: Any, sampling: Optional[SamplingConfig]) -> str:
+    """단계 캐시 키 (샘플링 실행은 샘플링 설정까지 포함)."""
+    key = config_hash(input_params, fields)
+    if sampling is not None:
+        key = f"{key}:{sampling.model_dump_json()}"
+    return key
+
+
+def _hierarchy_from_rates(
+    l1_hit_rate: float,
+    l2_hit_rate: float,
+    l3_hit_rate: Optional[float],
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = None,
+) -> MemoryHierarchyCheckpoint:
+    """레벨별 적중률로부터 레벨별 접근 횟수를 계산합니다."""
+    # 레벨별 접근 수: 하위 레벨 접근 = 상위 레벨 미스
+    l1_accesses = WORKLOAD_INSTRUCTIONS * MEMORY_REFS_PER_INSTRUCTION
+    l2_accesses = l1_accesses * (100 - max(80.0, l1_hit_rate)) / 100
+    l2_misses = l2_accesses * (100 - max(70.0, l2_hit_rate)) / 100
+    if l3_hit_rate is not None:
+        l3_accesses = l2_misses
+        dram_accesses = l3_accesses * (100 - l3_hit_rate) / 100
+    else:
+        l3_accesses = 0.0
+        dram_accesses = l2_misses
+    
+    return MemoryHierarchyCheckpoint(
+        l1_hit_rate=l1_hit_rate,
+        l2_hit_rate=l2_hit_rate,
+        l3_hit_rate=l3_hit_rate,
+        l1_accesses=l1_accesses,
+        l2_accesses=l2_accesses,
+        l3_accesses=l3_accesses,
+        dram_accesses=dram_accesses,
+        confidence_intervals=confidence_intervals,
+    )
+
+
+def _simulate_hierarchy(input_params: CPUArchitectureInput) -> MemoryHierarchyCheckpoint:
+    """캐시 계층의 적중률과 레벨별 접근 횟수를 계산합니다."""
+    # 간단한 모의 계산
+    # 적중률은 0~100% 범위로 제한 (지연이 큰 설정에서 음수가 되지 않도록)
+    l1_hit_rate = max(0.0, 95.0 - (input_params.l1_cache_config.latency * 2))
+    l2_hit_rate = max(0.0, 85.0 - (input_params.l2_cache_config.latency * 1))
+    l3_hit_rate = 70.0 if input_params.l3_cache_config else None
+    return _hierarchy_from_rates(l1_hit_rate, l2_hit_rate, l3_hit_rate)
+
+
+def _sample_hierarchy(
+    input_params: CPUArchitectureInput, sampling: SamplingConfig
+) -> MemoryHierarchyCheckpoint:
+    """메모리 접근을 표본 추출하여 레벨별 적중률과 신뢰구간을 추정합니다."""
+    model = _simulate_hierarchy(input_params)
+    p1 = model.l1_hit_rate / 100
+    p2 = model.l2_hit_rate / 100
+    p3 = model.l3_hit_rate / 100 if model.l3_hit_rate is not None else None
+    
+    def draw(rng, n):
+        # 접근 n개: L1 미스는 L2로, L2 미스는 L3로 전달
+        l1_hits = binomial(rng, n, p1)
+        l2_accesses = n - l1_hits
+        l2_hits = binomial(rng, l2_accesses, p2)
+        batch = {
+            "l1_hit_rate": bernoulli_summary(l1_hits, n),
+            "l2_hit_rate": bernoulli_summary(l2_hits, l2_accesses),
+        }
+        if p3 is not None:
+            l3_accesses = l2_accesses - l2_hits
+            batch["l3_hit_rate"] = bernoulli_summary(binomial(rng, l3_accesses, p3), l3_accesses)
+        return batch
+    
+    intervals = run_sampling(sampling, draw, default_metric="l1_hit_rate")
+    # 샘플이 부족해 신뢰구간이 없는 레벨은 모델 적중률을 그대로 사용
+    def estimate(name: str, model_rate: Optional[float]) -> Optional[float]:
+        return intervals[name].mean if name in intervals else model_rate
+    
+    return _hierarchy_from_rates(
+        estimate("l1_hit_rate", model.l1_hit_rate),
+        estimate("l2_hit_rate", model.l2_hit_rate),
+        estimate("l3_hit_rate", model.l3_hit_rate),
+        intervals,
+    )
+
+
+def _simulate_cpu(
+    input_params: CPUArchitectureInput,
+    sampling: Optional[SamplingConfig] = None,
+) -> Tuple[CPUArchitectureOutput, ActivityCounts]:
+    """CPU 성능 지표와 에너지 모델에 사용할 활동 횟수를 계산합니다 (에너지 제외)."""
+    if sampling is None:
+        compute = lambda: _simulate_hierarchy(input_params)
+    else:
+        compute = lambda: _sample_hierarchy(input_params, sampling)
+    hierarchy = _hierarchy_cache.get_or_compute(
+        _stage_key(input_params, CPU_HIERARCHY_FIELDS, sampling), compute
+    )
+    l1_hit_rate = hierarchy.l1_hit_rate
+    l2_hit_rate = hierarchy.l2_hit_rate
+    l3_hit_rate = hierarchy.l3_hit_rate
+    
+    # 모의 계산 (실제로는 복잡한 시뮬레이션 알고리즘)
+    base_ipc = min(input_params.issue_width, input_params.number_of_cores) * 0.8
+    cache_penalty = (100 - input_params.l1_cache_config.latency) / 100
+    ipc = base_ipc * cache_penalty
+    
+    amat = (
+        input_params.l1_cache_config.latency * (l1_hit_rate / 100) +
+        input_params.l2_cache_config.latency * ((100 - l1_hit_rate) / 100) * (l2_hit_rate / 100) +
+        (input_params.l3_cache_config.latency if input_params.l3_cache_config else 0) * 
+        ((100 - l2_hit_rate) / 100) * ((l3_hit_rate / 100) if l3_hit_rate else 0) +
+        input_params.main_memory_latency * ((100 - (l3_hit_rate or l2_hit_rate)) / 100)
+    )
+    
+    output = CPUArchitectureOutput(
+        ipc=max(0.1, ipc),
+        total_execution_time=1000.0 / (input_params.clock_frequency * ipc),
+        stall_rate=100 - (ipc / input_params.issue_width * 100),
+        l1_hit_rate=max(80.0, l1_hit_rate),
+        l2_hit_rate=max(70.0, l2_hit_rate),
+        l3_hit_rate=l3_hit_rate,
+        amat=amat,
+        mpi=(100 - l1_hit_rate) / 10,
+        coherence_misses=int(input_params.number_of_cores * 10),
+        bus_congestion=min(50.0, input_params.number_of_cores * 5),
+        total_energy=0.0,
+        edp=0.0,
+        confidence_intervals=hierarchy.confidence_intervals,
+    )
+    
+    activity = ActivityCounts(
+        instructions=WORKLOAD_INSTRUCTIONS,
+        execution_time=output.total_execution_time,
+        l1_accesses=hierarchy.l1_accesses,
+        l2_accesses=hierarchy.l2_accesses,
+        l3_accesses=hierarchy.l3_accesses,
+        dram_accesses=hierarchy.dram_accesses,
+    )
+    return output, activity
+
+
+def _simulate_yield(input_params: SemiconductorFabInput) -> YieldCheckpoint:
+    """수율과 등급 분포를 계산합니다."""
+    # 모의 계산
+    tech_factor = {
+        "28nm": 0.95,
+        "14nm": 0.90,
+        "7nm": 0.85,
+        "3nm": 0.75,
+    }.get(input_params.technology_node.value, 0.90)
+    
+    cpk_factor = input_params.cpk_target / 2.0
+    functional_yield = tech_factor * cpk_factor * 100
+    parametric_yield = functional_yield * 0.95
+    
+    # 등급 분포 계산
+    return YieldCheckpoint(
+        functional_yield=functional_yield,
+        parametric_yield=parametric_yield,
+        grade_a=parametric_yield * 0.2,
+        grade_b=parametric_yield * 0.5,
+        grade_c=parametric_yield * 0.3,
+    )
+
+
+def _sample_yield(input_params: SemiconductorFabInput, sampling: SamplingConfig) -> YieldCheckpoint:
+    """다이 단위로 표본 추출하여 수율과 등급 분포의 신뢰구간을 추정합니다."""
+    model = _simulate_yield(input_params)
+    p_functional = min(1.0, model.functional_yield / 100)
+    # 조건부 확률: 기능 통과 → 파라메트릭 통과 → 등급
+    p_parametric = model.parametric_yield / model.functional_yield if model.functional_yield else 0.0
+    p_grade_a = model.grade_a / model.parametric_yield if model.parametric_yield else 0.0
+    p_grade_b = (
+        model.grade_b / (model.parametric_yield - model.grade_a)
+        if model.parametric_yield > model.grade_a else 0.0
+    )
+    
+    def draw(rng, n):
+        functional = binomial(rng, n, p_functional)
+        parametric = binomial(rng, functional, p_parametric)
+        grade_a = binomial(rng, parametric, p_grade_a)
+        grade_b = binomial(rng, parametric - grade_a, p_grade_b)
+        return {
+            "functional_yield": bernoulli_summary(functional, n),
+            "parametric_yield": bernoulli_summary(parametric, n),
+            "grade_a": bernoulli_summary(grade_a, n),
+            "grade_b": bernoulli_summary(grade_b, n),
+            "grade_c": bernoulli_summary(parametric - grade_a - grade_b, n),
+        }
+    
+    intervals = run_sampling(sampling, draw, default_metric="functional_yield")
+    return YieldCheckpoint(
+        functional_yield=intervals["functional_yield"].mean,
+        parametric_yield=intervals["parametric_yield"].mean,
+        grade_a=intervals["grade_a"].mean,
+        grade_b=intervals["grade_b"].mean,
+        grade_c=intervals["grade_c"].mean,
+        confidence_intervals=intervals,
+    )
+
+
+def _apply_energy(output: CPUArchitectureOutput, breakdown: EnergyBreakdown) -> CPUArchitectureOutput:
+    """에너지 분해 결과로 총 에너지와 EDP를 채웁니다."""
+    output.energy_breakdown = breakdown
+    output.total_energy = breakdown.total
+    output.edp = breakdown.total * output.total_execution_time
+    return output
+
+
+def _run_cpu(
+    input_params: CPUArchitectureInput, sampling: Optional[SamplingConfig]
+) -> CPUArchitectureOutput:
+    """CPU 시뮬레이션 본체 (동기)."""
+    output, activity = _simulate_cpu(input_params, sampling)
+    breakdown = estimate_energy(energy_coefficients(input_params), activity)
+    return _apply_energy(output, breakdown)
+
+
+def _run_cpu_sweep(inputs: List[CPUArchitectureInput]) -> List[CPUArchitectureOutput]:
+    """CPU 스윕 본체 (동기)."""
+    results = [_simulate_cpu(params) for params in inputs]
+    breakdowns = estimate_energy_batch(inputs, [activity for _, activity in results])
+    return [
+        _apply_energy(output, breakdown)
+        for (output, _), breakdown in zip(results, breakdowns)
+    ]
+
+
+def _run_fab(
+    input_params: SemiconductorFabInput, sampling: Optional[SamplingConfig]
+) -> SemiconductorFabOutput:
+    """파브 시뮬레이션 본체 (동기)."""
+    if sampling is None:
+        compute = lambda: _simulate_yield(input_params)
+    else:
+        compute = lambda: _sample_yield(input_params, sampling)
+    yields = _yield_cache.get_or_compute(
+        _stage_key(input_params, FAB_YIELD_FIELDS, sampling), compute
+    )
+    intervals = yields.confidence_intervals or {}
+    functional_yield = yields.functional_yield
+    parametric_yield = yields.parametric_yield
+    grade_a, grade_b, grade_c = yields.grade_a, yields.grade_b, yields.grade_c
+
+    # OEE 계산
+    availability = (input_params.mtbf / (input_params.mtbf + input_params.mttr)) * 100
+    performance = min(100.0, (input_params.throughput_wph / 100) * 100)
+    quality = functional_yield
+    oee = (availability * performance * quality) / 10000
+
+    # 마스크 상각비 (간단한 모의)
+    mask_cost = {
+        "28nm": 1.0,
+        "14nm": 5.0,
+        "7nm": 20.0,
+        "3nm": 100.0,
+    }.get(input_params.technology_node.value, 10.0) * 1_000_000_000  # 억원 단위
+
+    mask_amortization = mask_cost / (input_params.throughput_wph * 24 * 30)  # 월간 처리량으로 나눔
+
+    return SemiconductorFabOutput(
+        parametric_yield=max(50.0, parametric_yield),
+        functional_yield=max(50.0, functional_yield),
+        binning_distribution=BinningDistribution(
+            grade_a=max(10.0, grade_a),
+            grade_b=max(20.0, grade_b),
+            grade_c=max(10.0, grade_c),
+            confidence_intervals={
+                name: intervals[name] for name in ("grade_a", "grade_b", "grade_c")
+            } if intervals else None,
+        ),
+        oee=max(50.0, oee),
+        wip_level=int(input_params.throughput_wph * 2),
+        bottleneck_station_id="Lithography_Scanner_02" if input_params.lithography_source.value == "euv" else None,
+        mask_amortization_cost=mask_amortization,
+        line_balance_efficiency=max(70.0, oee * 1.1),
+        confidence_intervals={
+            name: intervals[name] for name in ("functional_yield", "parametric_yield")
+        } if intervals else None,
+    )
+
+
+async def _offload(fn: Callable[..., T], *args: Any) -> T:
+    """CPU 연산을 이벤트 루프 밖(스레드 풀)에서 실행합니다. 프로파일링 중이면 해당 스레드도 측정합니다."""
+    return await asyncio.to_thread(tracked(fn), *args)
 
 
 class SimulatorEngine:
-    """시뮬레이터 실행 엔진 (모의 구현)."""
+    """
+    시뮬레이터 실행 엔진 (모의 구현).
+    
+    시뮬레이션은 이벤트 루프를 막지 않도록 스레드 풀에서 실행됩니다.
+    """
     
     @staticmethod
-    async def run_cpu_simulation(input_params: CPUArchitectureInput) -> CPUArchitectureOutput:
+    async def run_cpu_simulation(
+        input_params: CPUArchitectureInput,
+        sampling: Optional[SamplingConfig] = None,
+    ) -> CPUArchitectureOutput:
         """
         CPU 아키텍처 시뮬레이션 실행 (모의).
         
         실제 구현에서는 여기에 실제 시뮬레이션 로직이 들어갑니다.
+        sampling이 주어지면 캐시 계층을 표본 추출하고 신뢰구간을 함께 반환합니다.
         """
-        # 모의 계산 (실제로는 복잡한 시뮬레이션 알고리즘)
-        base_ipc = min(input_params.issue_width, input_params.number_of_cores) * 0.8
-        cache_penalty = (100 - input_params.l1_cache_config.latency) / 100
-        ipc = base_ipc * cache_penalty
-        
-        # 간단한 모의 계산
-        l1_hit_rate = 95.0 - (input_params.l1_cache_config.latency * 2)
-        l2_hit_rate = 85.0 - (input_params.l2_cache_config.latency * 1)
-        l3_hit_rate = 70.0 if input_params.l3_cache_config else None
-        
-        amat = (
-            input_params.l1_cache_config.latency * (l1_hit_rate / 100) +
-            input_params.l2_cache_config.latency * ((100 - l1_hit_rate) / 100) * (l2_hit_rate / 100) +
-            (input_params.l3_cache_config.latency if input_params.l3_cache_config else 0) * 
-            ((100 - l2_hit_rate) / 100) * ((l3_hit_rate / 100) if l3_hit_rate else 0) +
-            input_params.main_memory_latency * ((100 - (l3_hit_rate or l2_hit_rate)) / 100)
-        )
+        return await _offload(_run_cpu, input_params, sampling)
+    
+    @staticmethod
+    async def run_cpu_sweep(
+        inputs: List[CPUArchitectureInput],
+    ) -> List[CPUArchitectureOutput]:
+        """
+        여러 CPU 구성을 한 번에 시뮬레이션합니다 (설계 공간 탐색용).
         
-        return CPUArchitectureOutput(
-            ipc=max(0.1, ipc),
-            total_execution_time=1000.0 / (input_params.clock_frequency * ipc),
-            stall_rate=100 - (ipc / input_params.issue_width * 100),
-            l1_hit_rate=max(80.0, l1_hit_rate),
-            l2_hit_rate=max(70.0, l2_hit_rate),
-            l3_hit_rate=l3_hit_rate,
-            amat=amat,
-            mpi=(100 - l1_hit_rate) / 10,
-            coherence_misses=int(input_params.number_of_cores * 10),
-            bus_congestion=min(50.0, input_params.number_of_cores * 5),
-            total_energy=input_params.clock_frequency * input_params.number_of_cores * 10,
-            edp=input_params.clock_frequency * input_params.number_of_cores * 10 * 1000.0,
-        )
+        에너지는 배치 단위로 계산하여 구성 간 계수를 재사용합니다.
+        """
+        return await _offload(_run_cpu_sweep, inputs)
     
     @staticmethod
-    async def run_fab_simulation(input_params: SemiconductorFabInput) -> SemiconductorFabOutput:
+    async def run_fab_simulation(
+        input_params: SemiconductorFabInput,
+        sampling: Optional[SamplingConfig] = None,
+    ) -> SemiconductorFabOutput:
         """
         반도체 파브 시뮬레이션 실행 (모의).
         
         실제 구현에서는 여기에 실제 시뮬레이션 로직이 들어갑니다.
+        sampling이 주어지면 수율을 다이 단위로 표본 추출하고 신뢰구간을 함께 반환합니다.
         """
-        # 모의 계산
-        tech_factor = {
-            "28nm": 0.95,
-            "14nm": 0.90,
-            "7nm": 0.85,
-            "3nm": 0.75,
-        }.get(input_params.technology_node.value, 0.90)
-        
-        cpk_factor = input_params.cpk_target / 2.0
-        functional_yield = tech_factor * cpk_factor * 100
-        parametric_yield = functional_yield * 0.95
-        
-        # 등급 분포 계산
-        grade_a = parametric_yield * 0.2
-        grade_b = parametric_yield * 0.5
-        grade_c = parametric_yield * 0.3
-        
-        # OEE 계산
-        availability = (input_params.mtbf / (input_params.mtbf + input_params.mttr)) * 100
-        performance = min(100.0, (input_params.throughput_wph / 100) * 100)
-        quality = functional_yield
-        oee = (availability * performance * quality) / 10000
-        
-        # 마스크 상각비 (간단한 모의)
-        mask_cost = {
-            "28nm": 1.0,
-            "14nm": 5.0,
-            "7nm": 20.0,
-            "3nm": 100.0,
-        }.get(input_params.technology_node.value, 10.0) * 1_000_000_000  # 억원 단위
-        
-        mask_amortization = mask_cost / (input_params.throughput_wph * 24 * 30)  # 월간 처리량으로 나눔
-        
-        return SemiconductorFabOutput(
-            parametric_yield=max(50.0, parametric_yield),
-            functional_yield=max(50.0, functional_yield),
-            binning_distribution=BinningDistribution(
-                grade_a=max(10.0, grade_a),
-                grade_b=max(20.0, grade_b),
-                grade_c=max(10.0, grade_c),
-            ),
-            oee=max(50.0, oee),
-            wip_level=int(input_params.throughput_wph * 2),
-            bottleneck_station_id="Lithography_Scanner_02" if input_params.lithography_source.value == "euv" else None,
-            mask_amortization_cost=mask_amortization,
-            line_balance_efficiency=max(70.0, oee * 1.1),
-        )
+        return await _offload(_run_fab, input_params, sampling)
+
+    @staticmethod
+    async def run_fab_batch(
+        inputs: List[SemiconductorFabInput],
+    ) -> List[SemiconductorFabOutput]:
+        """
+        여러 파브 구성을 한 번에 시뮬레이션합니다 (시나리오 비교용).
+
+        수율 단계는 체크포인트 캐시를 공유하므로 수율 관련 필드가 같은 구성은
+        다시 계산하지 않습니다.
+        """
+        return await _offload(lambda: [_run_fab(params, None) for params in inputs])
 
 
 async def extract_parameters_from_llm(
@@ -1,12 +1,71 @@
 """시뮬레이션 결과 피드백 생성."""
 
-from typing import Dict, Any
-from .schemas import CPUArchitectureOutput, SemiconductorFabOutput
+from typing import Dict, Any, List, Optional
+from .schemas import (
+    CPUArchitectureOutput,
+    SemiconductorFabOutput,
+    ConfidenceInterval,
+    MetricRanking,
+    ScenarioResult,
+)
 from .enums import SimulatorType
 
+# 비교 요약에 표시할 지표 이름
+METRIC_LABELS = {
+    "ipc": "IPC",
+    "total_execution_time": "실행 시간(초)",
+    "stall_rate": "정지 비율(%)",
+    "l1_hit_rate": "L1 적중률(%)",
+    "l2_hit_rate": "L2 적중률(%)",
+    "amat": "AMAT",
+    "mpi": "MPI",
+    "bus_congestion": "버스 혼잡도(%)",
+    "total_energy": "총 에너지(J)",
+    "edp": "EDP(J·s)",
+    "parametric_yield": "파라메트릭 수율(%)",
+    "functional_yield": "기능적 수율(%)",
+    "oee": "OEE(%)",
+    "wip_level": "WIP",
+    "mask_amortization_cost": "마스크 상각비",
+    "line_balance_efficiency": "라인 밸런싱 효율(%)",
+}
+
+
+def _ci(intervals: Optional[Dict[str, ConfidenceInterval]], name: str) -> str:
+    """
+    신뢰구간이 있으면 ' (±반폭, 신뢰수준 CI, n=샘플 수)' 형태로 반환합니다.
+
+    목표 정밀도를 적용한 지표는 목표 달성 여부를 함께 표시합니다.
+    """
+    if not intervals or name not in intervals:
+        return ""
+    ci = intervals[name]
+    target = ""
+    if ci.target_met is True:
+        target = f", 목표 ±{ci.target_half_width:.3f} 달성"
+    elif ci.target_met is False:
+        target = f", 목표 ±{ci.target_half_width:.3f} 미달 (최대 샘플 수 도달)"
+    return f" (±{ci.half_width:.3f}, {ci.confidence_level * 100:.0f}% CI, n={ci.samples:,}{target})"
+
 
 def generate_cpu_feedback(output: CPUArchitectureOutput) -> str:
     """CPU 시뮬레이터 결과 피드백 생성."""
+    ci = output.confidence_intervals
+    l3_hit_rate = (
+        f"{output.l3_hit_rate:.2f}%{_ci(ci, 'l3_hit_rate')}"
+        if output.l3_hit_rate is not None else "미설정"
+    )
+    energy_detail = ""
+    if output.energy_breakdown is not None:
+        b = output.energy_breakdown
+        energy_detail = f"""
+- **에너지 분해**:
+  - 코어 동적: {b.core_dynamic:.2f} J
+  - 캐시 동적: {b.cache_dynamic:.2f} J
+  - DRAM: {b.dram:.2f} J
+  - 버스: {b.bus:.2f} J
+  - 누설: {b.leakage:.2f} J"""
+
     feedback = f"""
 ## CPU 아키텍처 시뮬레이션 결과
 
@@ -16,9 +75,9 @@ def generate_cpu_feedback(output: CPUArchitectureOutput) -> str:
 - **정지 비율**: {output.stall_rate:.2f}%
 
 ### 메모리 분석
-- **L1 적중률**: {output.l1_hit_rate:.2f}%
-- **L2 적중률**: {output.l2_hit_rate:.2f}%
-- **L3 적중률**: {output.l3_hit_rate:.2f}% (설정된 경우)
+- **L1 적중률**: {output.l1_hit_rate:.2f}%{_ci(ci, 'l1_hit_rate')}
+- **L2 적중률**: {output.l2_hit_rate:.2f}%{_ci(ci, 'l2_hit_rate')}
+- **L3 적중률**: {l3_hit_rate}
 - **평균 메모리 접근 시간 (AMAT)**: {output.amat:.2f} Cycles
 - **명령어 1,000개당 미스 횟수 (MPI)**: {output.mpi:.2f}
 
@@ -28,23 +87,25 @@ def generate_cpu_feedback(output: CPUArchitectureOutput) -> str:
 
 ### 전력 소비
 - **총 에너지**: {output.total_energy:.2f} Joules
-- **에너지-지연 곱 (EDP)**: {output.edp:.2f}
+- **에너지-지연 곱 (EDP)**: {output.edp:.2f} J·s{energy_detail}
 """
     return feedback.strip()
 
 
 def generate_fab_feedback(output: SemiconductorFabOutput) -> str:
     """반도체 파브 시뮬레이터 결과 피드백 생성."""
+    ci = output.confidence_intervals
+    bin_ci = output.binning_distribution.confidence_intervals
     feedback = f"""
 ## 반도체 파브 시뮬레이션 결과
 
 ### 수율 분석
-- **파라메트릭 수율**: {output.parametric_yield:.2f}%
-- **기능적 수율**: {output.functional_yield:.2f}%
+- **파라메트릭 수율**: {output.parametric_yield:.2f}%{_ci(ci, 'parametric_yield')}
+- **기능적 수율**: {output.functional_yield:.2f}%{_ci(ci, 'functional_yield')}
 - **등급 분포**:
-  - 최고 등급 (Grade A): {output.binning_distribution.grade_a:.2f}%
-  - 중간 등급 (Grade B): {output.binning_distribution.grade_b:.2f}%
-  - 하위 등급 (Grade C): {output.binning_distribution.grade_c:.2f}%
+  - 최고 등급 (Grade A): {output.binning_distribution.grade_a:.2f}%{_ci(bin_ci, 'grade_a')}
+  - 중간 등급 (Grade B): {output.binning_distribution.grade_b:.2f}%{_ci(bin_ci, 'grade_b')}
+  - 하위 등급 (Grade C): {output.binning_distribution.grade_c:.2f}%{_ci(bin_ci, 'grade_c')}
 
 ### 운영 효율 지표
 - **OEE (Overall Equipment Effectiveness)**: {output.oee:.2f}%
@@ -58,6 +119,53 @@ def generate_fab_feedback(output: SemiconductorFabOutput) -> str:
     return feedback.strip()
 
 
+def generate_comparison_feedback(
+    scenarios: List[ScenarioResult], rankings: List[MetricRanking]
+) -> str:
+    """시나리오 비교 결과를 하나의 표로 요약합니다 (변형안은 기준안 대비 변화율 표시)."""
+    metrics = [ranking.metric for ranking in rankings]
+    header = "| 지표 | " + " | ".join(s.name for s in scenarios) + " | 최선 |"
+    divider = "|" + "---|" * (len(scenarios) + 2)
+    rows = []
+    for ranking in rankings:
+        cells = []
+        for scenario in scenarios:
+            d = scenario.deltas[ranking.metric]
+            cell = f"{d.value:,.2f}"
+            if scenario.index > 0 and d.delta_percent is not None:
+                cell += f" ({d.delta_percent:+.1f}%)"
+            cells.append(cell)
+        best = scenarios[ranking.ranking[0]].name
+        rows.append(f"| {METRIC_LABELS.get(ranking.metric, ranking.metric)} | " + " | ".join(cells) + f" | {best} |")
+
+    # 기준안보다 나아진 지표가 가장 많은 변형안
+    wins = {
+        scenario.index: sum(
+            1 for r in rankings if r.ranking.index(scenario.index) < r.ranking.index(0)
+        )
+        for scenario in scenarios[1:]
+    }
+    if wins and max(wins.values()) > 0:
+        best_index = max(wins, key=lambda i: (wins[i], -i))
+        verdict = (
+            f"기준안 대비 가장 많은 지표({wins[best_index]}/{len(metrics)}개)가 "
+            f"개선된 시나리오는 **{scenarios[best_index].name}**입니다."
+        )
+    else:
+        verdict = "기준안보다 개선된 변형안이 없습니다."
+
+    feedback = f"""
+## 시나리오 비교 결과 (기준안 + 변형안 {len(scenarios) - 1}개)
+
+{header}
+{divider}
+""" + "\n".join(rows) + f"""
+
+{verdict}
+"""
+    return feedback.strip()
+
+
 def generate_feedback(simulator_type: SimulatorType, output: Any) -> str:
     """시뮬레이터 타입에 따라 피드백 생성."""
     if simulator_type == SimulatorType.CPU_ARCHITECTURE:
@@ -0,0 +1,92 @@
+"""캐시 설정 파싱 및 정규화.
+
+'32KB', '8MB' 같은 크기 문자열을 바이트로 변환하고, 연관도/블록 크기와의
+교차 제약(세트 수는 2의 거듭제곱)을 검사하여 엔진이 바로 사용할 수 있는
+불변(frozen) 내부 설정을 만듭니다. 같은 설정은 한 번만 계산됩니다.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:I?B)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+# 캐시 지연 시간 상한 (Cycles). 엔진의 IPC 모델은 L1 지연 100 이상에서 0 이하가 됨
+MAX_CACHE_LATENCY = 99
+
+
+def _is_power_of_two(value: int) -> bool:
+    return value > 0 and value & (value - 1) == 0
+
+
+@lru_cache(maxsize=256)
+def parse_size(size: str) -> int:
+    """
+    캐시 크기 문자열을 바이트로 변환합니다.
+
+    '32KB', '8MB', '1.5MB', '512B', '64K' 형식을 지원합니다 (1KB = 1024B).
+
+    Raises:
+        ValueError: 형식이 올바르지 않거나 정수 바이트가 아닌 경우
+    """
+    match = _SIZE_PATTERN.match(size)
+    if not match:
+        raise ValueError(f"캐시 크기 형식이 올바르지 않습니다: {size!r} (예: '32KB', '8MB')")
+    value, unit = match.groups()
+    size_bytes = float(value) * _SIZE_UNITS[unit.upper()]
+    if not size_bytes.is_integer() or size_bytes <= 0:
+        raise ValueError(f"캐시 크기는 양의 정수 바이트여야 합니다: {size!r}")
+    return int(size_bytes)
+
+
+@dataclass(frozen=True)
+class NormalizedCacheConfig:
+    """정규화된 캐시 설정 (엔진 내부용)."""
+    size_bytes: int
+    ways: int
+    block_size: int
+    sets: int
+    line_bits: int  # 블록 오프셋 비트 수
+    set_bits: int  # 세트 인덱스 비트 수
+    latency: int
+
+
+@lru_cache(maxsize=1024)
+def normalize_cache(
+    size: str, associativity: int, block_size: int, latency: int
+) -> NormalizedCacheConfig:
+    """
+    캐시 설정을 검증하고 정규화합니다.
+
+    Raises:
+        ValueError: 교차 제약을 위반한 경우
+    """
+    size_bytes = parse_size(size)
+    if associativity < 1:
+        raise ValueError(f"연관도는 1 이상이어야 합니다: {associativity}")
+    if not _is_power_of_two(block_size):
+        raise ValueError(f"블록 크기는 2의 거듭제곱이어야 합니다: {block_size}")
+    if not 0 <= latency <= MAX_CACHE_LATENCY:
+        raise ValueError(f"지연 시간은 0 이상 {MAX_CACHE_LATENCY} 이하여야 합니다: {latency}")
+
+    way_bytes = associativity * block_size
+    if size_bytes % way_bytes:
+        raise ValueError(
+            f"캐시 크기 {size}는 연관도 × 블록 크기({associativity} × {block_size}B)로 나누어떨어져야 합니다."
+        )
+    sets = size_bytes // way_bytes
+    if not _is_power_of_two(sets):
+        raise ValueError(
+            f"세트 수는 2의 거듭제곱이어야 합니다: {size} / ({associativity} × {block_size}B) = {sets}"
+        )
+
+    return NormalizedCacheConfig(
+        size_bytes=size_bytes,
+        ways=associativity,
+        block_size=block_size,
+        sets=sets,
+        line_bits=block_size.bit_length() - 1,
+        set_bits=sets.bit_length() - 1,
+        latency=latency,
+    )
@@ -0,0 +1,241 @@
+"""요청 단위 핫패스 프로파일링.
+
+프로파일링 요청은 다음을 수집합니다.
+- 샘플링 프로파일러: 별도 스레드가 요청을 처리하는 스레드의 스택을 주기적으로 채집
+  (collapsed stacks / speedscope JSON으로 내보내기)
+- 단계별 wall/CPU 시간
+- 단계별 메모리 할당 (tracemalloc: 새로 할당된 블록 수, 바이트, 최대 사용량)
+
+tracemalloc과 스택 샘플링은 프로세스 전역 상태를 사용하므로 한 번에 하나의
+프로파일만 실행합니다 (profile_lock). 같은 이벤트 루프에서 동시에 처리되는
+다른 요청의 스택이 섞일 수 있습니다.
+
+시뮬레이션은 스레드 풀에서 실행되므로, tracked()로 감싼 함수는 실행 중인 세션이
+있으면 자신의 스레드를 샘플링 대상에 추가하고 CPU 시간을 현재 단계에 합산합니다.
+"""
+
+import asyncio
+import contextvars
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TypeVar
+
+from .schemas import ProfileSummary, StageProfile
+
+# 스택 최대 깊이
+MAX_STACK_DEPTH = 128
+# tracemalloc이 저장할 호출 스택 프레임 수
+TRACEMALLOC_FRAMES = 1
+
+profile_lock = asyncio.Lock()
+
+# 현재 요청의 프로파일 세션 (asyncio.to_thread는 컨텍스트를 복사하므로 워커 스레드에서도 보임)
+_current_session: "contextvars.ContextVar[Optional[ProfileSession]]" = contextvars.ContextVar(
+    "profile_session", default=None
+)
+
+T = TypeVar("T")
+
+
+class StackSampler(threading.Thread):
+    """대상 스레드들의 스택을 주기적으로 채집하는 샘플링 프로파일러."""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.target_thread_ids: Set[int] = {target_thread_id}
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in list(self.target_thread_ids):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self._record(frame)
+
+    def _record(self, frame: Any) -> None:
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        # 루트 → 리프 순서
+        self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class ProfileSession:
+    """요청 하나의 프로파일 수집 세션."""
+
+    def __init__(self, interval: float):
+        self.id = uuid.uuid4().hex
+        self.interval = interval
+        self.stages: List[StageProfile] = []
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracemalloc = False
+        self._started_at = 0.0
+        self._token: Optional[contextvars.Token] = None
+        # 워커 스레드에서 사용한 CPU 시간 누적 (초)
+        self._offloaded_cpu = 0.0
+        self._cpu_lock = threading.Lock()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._sampler = StackSampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        self._token = _current_session.set(self)
+        self._started_at = time.perf_counter()
+
+    def stop(self) -> "ProfileReport":
+        wall_ms = (time.perf_counter() - self._started_at) * 1000
+        _current_session.reset(self._token)
+        self._sampler.stop()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        return ProfileReport(self.id, self.stages, self._sampler.stacks, self.interval, wall_ms)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """단계 하나의 시간과 메모리 할당을 측정합니다."""
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base_memory, _ = tracemalloc.get_traced_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        offloaded_start = self._offloaded_cpu
+        try:
+            yield
+        finally:
+            cpu_ms = (
+                time.thread_time() - cpu_start + self._offloaded_cpu - offloaded_start
+            ) * 1000
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+            _, peak_memory = tracemalloc.get_traced_memory()
+            diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+            self.stages.append(
+                StageProfile(
+                    name=name,
+                    wall_ms=wall_ms,
+                    cpu_ms=cpu_ms,
+                    allocated_blocks=sum(stat.count_diff for stat in diff if stat.count_diff > 0),
+                    allocated_bytes=sum(stat.size_diff for stat in diff if stat.size_diff > 0),
+                    peak_bytes=max(0, peak_memory - base_memory),
+                )
+            )
+
+    def _run_tracked(self, fn: Callable[..., T], *args: Any) -> T:
+        thread_id = threading.get_ident()
+        self._sampler.target_thread_ids.add(thread_id)
+        cpu_start = time.thread_time()
+        try:
+            return fn(*args)
+        finally:
+            with self._cpu_lock:
+                self._offloaded_cpu += time.thread_time() - cpu_start
+            self._sampler.target_thread_ids.discard(thread_id)
+
+
+def tracked(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    워커 스레드에서 실행될 fn을 감쌉니다.
+
+    호출 시점의 컨텍스트에 프로파일 세션이 있으면 그 스레드의 스택과 CPU 시간을 세션에 포함합니다.
+    """
+    def wrapper(*args: Any) -> T:
+        session = _current_session.get()
+        if session is None:
+            return fn(*args)
+        return session._run_tracked(fn, *args)
+    return wrapper
+
+
+class ProfileReport:
+    """완료된 프로파일 (다운로드용 아티팩트)."""
+
+    def __init__(
+        self,
+        profile_id: str,
+        stages: List[StageProfile],
+        stacks: Counter,
+        interval: float,
+        wall_ms: float,
+    ):
+        self.id = profile_id
+        self.stages = stages
+        self.stacks = stacks
+        self.interval = interval
+        self.wall_ms = wall_ms
+
+    def summary(self, download_url: str) -> ProfileSummary:
+        return ProfileSummary(
+            profile_id=self.id,
+            wall_ms=self.wall_ms,
+            sample_count=sum(self.stacks.values()),
+            stages=self.stages,
+            download_url=download_url,
+        )
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg collapsed stack 형식 (flamegraph.pl, speedscope 호환)."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """speedscope 'sampled' 프로파일 JSON."""
+        frame_index: Dict[str, int] = {}
+        frames: List[Dict[str, str]] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self.stacks.items():
+            indices = []
+            for name in stack.split(";"):
+                if name not in frame_index:
+                    frame_index[name] = len(frames)
+                    frames.append({"name": name})
+                indices.append(frame_index[name])
+            samples.append(indices)
+            weights.append(count * self.interval * 1000)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": f"simulation {self.id}",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": f"simulation {self.id}",
+            "exporter": "simulation-chatbot-api",
+        }
+
+
+class ProfileStore:
+    """최근 프로파일을 보관하는 저장소 (오래된 것부터 제거)."""
+
+    def __init__(self, max_profiles: int):
+        self.max_profiles = max_profiles
+        self._reports: "OrderedDict[str, ProfileReport]" = OrderedDict()
+
+    def put(self, report: ProfileReport) -> None:
+        self._reports[report.id] = report
+        while len(self._reports) > self.max_profiles:
+            self._reports.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[ProfileReport]:
+        return self._reports.get(profile_id)
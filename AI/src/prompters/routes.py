@@ -1,7 +1,12 @@
 """FastAPI 라우터 정의."""
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+import hmac
+from contextlib import nullcontext
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel
+from typing import Dict, Any, Awaitable, Callable, Optional
+from settings import settings
 from .schemas import (
     SimulationRequest,
     SimulationResponse,
@@ -9,70 +14,294 @@ from .schemas import (
     CPUArchitectureOutput,
     SemiconductorFabInput,
     SemiconductorFabOutput,
+    CPUSweepRequest,
+    CPUSweepResponse,
+    ComparisonRequest,
+    ComparisonResponse,
+    SamplingConfig,
+)
+from .enums import SimulatorType, RequestPriority
+from .admission import (
+    AdmissionController,
+    AdmissionRejected,
+    RateLimiter,
+    SingleFlight,
+    parse_trusted_proxies,
+    resolve_client_ip,
 )
-from .enums import SimulatorType
 from .evaluation import SimulatorEngine, extract_parameters_from_llm
-from .feedback import generate_feedback
+from .distributed import SweepCoordinator, SweepError, SweepUnitError, parse_worker_addresses
+from .validation import SweepValidationError, validate_cpu_rows
+from .comparison import compare_outputs
+from .feedback import generate_comparison_feedback, generate_feedback
+from .profiling import ProfileSession, ProfileStore, profile_lock
 from .outline import CPU_ARCHITECTURE_PROMPT_TEMPLATE, SEMICONDUCTOR_FAB_PROMPT_TEMPLATE
 
 router = APIRouter(prefix="/api/v1/simulate", tags=["simulation"])
 
+# 수락 제어 (프로세스 단위)
+rate_limiter = RateLimiter(settings.rate_limit_per_second, settings.rate_limit_burst)
+admission = AdmissionController(
+    settings.max_concurrent_simulations,
+    settings.max_queued_simulations,
+    settings.admission_queue_timeout,
+)
+single_flight = SingleFlight()
+trusted_proxies = parse_trusted_proxies(settings.trusted_proxies)
+profile_store = ProfileStore(settings.max_stored_profiles)
+
 
 @router.post("/", response_model=SimulationResponse)
-async def run_simulation(request: SimulationRequest) -> SimulationResponse:
+async def run_simulation(
+    request: SimulationRequest, http_request: Request
+) -> SimulationResponse:
     """
     시뮬레이션을 실행합니다.
     
     사용자의 자연어 메시지에서 파라미터를 추출하고 시뮬레이션을 실행합니다.
+    클라이언트별 요청 한도를 넘으면 429, 서버가 혼잡하면 503을 Retry-After와 함께 반환합니다.
+    profile=true이면 요청을 프로파일링하여 요약과 다운로드 경로를 함께 반환합니다.
     """
     try:
-        # 파라미터 추출 (LLM 사용)
+        rate_limiter.check(_client_id(http_request))
+        
+        if not request.profile:
+            return await _execute_simulation(request, None)
+        
+        _require_profiling_access(http_request)
+        async with profile_lock:
+            session = ProfileSession(settings.profile_sample_interval)
+            session.start()
+            try:
+                response = await _execute_simulation(request, session)
+            finally:
+                report = session.stop()
+            profile_store.put(report)
+        response.profile = report.summary(f"{router.prefix}/profiles/{report.id}")
+        return response
+            
+    except HTTPException:
+        raise
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
+    except ValueError as e:
+        # Pydantic ValidationError 포함
+        raise HTTPException(status_code=422, detail=f"잘못된 시뮬레이션 파라미터: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"시뮬레이션 실행 중 오류 발생: {str(e)}")
+
+
+async def _execute_simulation(
+    request: SimulationRequest, session: Optional[ProfileSession]
+) -> SimulationResponse:
+    """파라미터 추출부터 피드백 생성까지 실행합니다. session이 있으면 단계별로 측정합니다."""
+    def stage(name: str):
+        return session.stage(name) if session is not None else nullcontext()
+    
+    # 프로파일링 요청은 자신의 실행을 측정해야 하므로 병합하지 않음
+    coalesce = session is None
+    
+    # 파라미터 추출 (LLM 사용)
+    with stage("extract_parameters"):
         extracted_params = await extract_parameters_from_llm(
             request.user_message, request.simulator_type
         )
-        
-        # 입력 파라미터 구성
-        if request.simulator_type == SimulatorType.CPU_ARCHITECTURE:
+    
+    # 입력 파라미터 구성
+    if request.simulator_type == SimulatorType.CPU_ARCHITECTURE:
+        with stage("build_input"):
             # 사용자가 제공한 입력이 있으면 사용, 없으면 추출된 파라미터로 생성
             if request.cpu_input:
                 cpu_input = request.cpu_input
             else:
                 # 추출된 파라미터로 기본값과 병합하여 생성
                 cpu_input = _build_cpu_input_from_params(extracted_params)
-            
-            # 시뮬레이션 실행
-            output = await SimulatorEngine.run_cpu_simulation(cpu_input)
-            
-            # 피드백 생성
-            feedback_message = generate_feedback(SimulatorType.CPU_ARCHITECTURE, output)
-            
-            return SimulationResponse(
-                simulator_type=SimulatorType.CPU_ARCHITECTURE,
-                message=feedback_message,
-                cpu_output=output,
-                extracted_params=extracted_params,
+        
+        # 시뮬레이션 실행 (동일 입력은 병합)
+        with stage("simulate"):
+            output = await _run_admitted(
+                SimulatorType.CPU_ARCHITECTURE,
+                cpu_input,
+                request.sampling,
+                lambda: SimulatorEngine.run_cpu_simulation(cpu_input, request.sampling),
+                coalesce=coalesce,
             )
-            
-        elif request.simulator_type == SimulatorType.SEMICONDUCTOR_FAB:
+        
+        # 피드백 생성
+        with stage("feedback"):
+            feedback_message = generate_feedback(SimulatorType.CPU_ARCHITECTURE, output)
+        
+        return SimulationResponse(
+            simulator_type=SimulatorType.CPU_ARCHITECTURE,
+            message=feedback_message,
+            cpu_output=output,
+            extracted_params=extracted_params,
+        )
+        
+    elif request.simulator_type == SimulatorType.SEMICONDUCTOR_FAB:
+        with stage("build_input"):
             if request.fab_input:
                 fab_input = request.fab_input
             else:
                 fab_input = _build_fab_input_from_params(extracted_params)
-            
-            output = await SimulatorEngine.run_fab_simulation(fab_input)
+        
+        with stage("simulate"):
+            output = await _run_admitted(
+                SimulatorType.SEMICONDUCTOR_FAB,
+                fab_input,
+                request.sampling,
+                lambda: SimulatorEngine.run_fab_simulation(fab_input, request.sampling),
+                coalesce=coalesce,
+            )
+        with stage("feedback"):
             feedback_message = generate_feedback(SimulatorType.SEMICONDUCTOR_FAB, output)
-            
-            return SimulationResponse(
-                simulator_type=SimulatorType.SEMICONDUCTOR_FAB,
-                message=feedback_message,
-                fab_output=output,
-                extracted_params=extracted_params,
+        
+        return SimulationResponse(
+            simulator_type=SimulatorType.SEMICONDUCTOR_FAB,
+            message=feedback_message,
+            fab_output=output,
+            extracted_params=extracted_params,
+        )
+    else:
+        raise HTTPException(status_code=400, detail="알 수 없는 시뮬레이터 타입입니다.")
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, http_request: Request, format: str = "speedscope") -> Response:
+    """
+    저장된 프로파일 아티팩트를 내려받습니다.
+    
+    format: speedscope (JSON, https://www.speedscope.app) 또는 collapsed (flamegraph.pl 입력 형식)
+    """
+    _require_profiling_access(http_request)
+    report = profile_store.get(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    
+    if format == "speedscope":
+        return JSONResponse(
+            report.to_speedscope(),
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'},
+        )
+    if format == "collapsed":
+        return PlainTextResponse(
+            report.to_collapsed(),
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.collapsed.txt"'},
+        )
+    raise HTTPException(status_code=400, detail="format은 speedscope 또는 collapsed여야 합니다.")
+
+
+@router.post("/sweep", response_model=CPUSweepResponse)
+async def run_cpu_sweep(request: CPUSweepRequest, http_request: Request) -> CPUSweepResponse:
+    """
+    여러 CPU 구성을 한 번에 시뮬레이션합니다 (설계 공간 탐색).
+    
+    워커가 설정되어 있으면(SWEEP_WORKERS) 분산 실행하고, 없으면 로컬에서 실행합니다.
+    """
+    try:
+        rate_limiter.check(_client_id(http_request))
+        cpu_inputs = validate_cpu_rows(request.cpu_inputs)
+        workers = parse_worker_addresses(settings.sweep_workers)
+        
+        async def sweep():
+            if not workers:
+                return await SimulatorEngine.run_cpu_sweep(cpu_inputs)
+            coordinator = SweepCoordinator(
+                workers,
+                unit_size=settings.sweep_unit_size,
+                unit_timeout=settings.sweep_unit_timeout,
+                token=settings.sweep_worker_token,
             )
+            return await coordinator.run(cpu_inputs)
+        
+        outputs = await admission.run(RequestPriority.BATCH, sweep)
+        return CPUSweepResponse(cpu_outputs=outputs)
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
+    except SweepValidationError as e:
+        raise HTTPException(status_code=422, detail={"message": str(e), "errors": e.to_detail()})
+    except SweepUnitError as e:
+        raise HTTPException(status_code=500, detail=f"스윕 실행 중 오류 발생: {str(e)}")
+    except SweepError as e:
+        raise HTTPException(status_code=503, detail=f"분산 스윕 실행 실패: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스윕 실행 중 오류 발생: {str(e)}")
+
+
+@router.post("/compare", response_model=ComparisonResponse)
+async def compare_scenarios(request: ComparisonRequest, http_request: Request) -> ComparisonResponse:
+    """
+    기준안과 변형안들을 한 번의 배치로 시뮬레이션하고 기준안 대비 지표 변화와 순위를 반환합니다.
+    
+    변형안끼리 공유하는 단계(캐시 계층, 수율)는 체크포인트 캐시에서 재사용됩니다.
+    """
+    try:
+        rate_limiter.check(_client_id(http_request))
+        
+        # 기준안/변형안 조합은 ComparisonRequest에서 검증됨
+        if request.simulator_type == SimulatorType.CPU_ARCHITECTURE:
+            cpu_inputs = [request.cpu_baseline, *request.cpu_variants]
+            run = lambda: SimulatorEngine.run_cpu_sweep(cpu_inputs)
         else:
-            raise HTTPException(status_code=400, detail="알 수 없는 시뮬레이터 타입입니다.")
-            
+            fab_inputs = [request.fab_baseline, *request.fab_variants]
+            run = lambda: SimulatorEngine.run_fab_batch(fab_inputs)
+        
+        outputs = await admission.run(RequestPriority.BATCH, run)
+        scenarios, rankings = compare_outputs(request.simulator_type, outputs)
+        return ComparisonResponse(
+            simulator_type=request.simulator_type,
+            message=generate_comparison_feedback(scenarios, rankings),
+            scenarios=scenarios,
+            rankings=rankings,
+        )
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"시뮬레이션 실행 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"시나리오 비교 중 오류 발생: {str(e)}")
+
+
+def _client_id(http_request: Request) -> str:
+    """레이트 리미팅에 사용할 클라이언트 식별자 (신뢰 프록시 뒤에서만 X-Forwarded-For 사용)."""
+    return resolve_client_ip(
+        http_request.client.host if http_request.client else None,
+        http_request.headers.get("x-forwarded-for"),
+        trusted_proxies,
+    )
+
+
+def _require_profiling_access(http_request: Request) -> None:
+    """프로파일링은 디버그 모드이거나 관리자 토큰이 일치할 때만 허용합니다."""
+    if settings.debug:
+        return
+    token = http_request.headers.get("x-admin-token")
+    if settings.admin_token and token and hmac.compare_digest(token, settings.admin_token):
+        return
+    raise HTTPException(status_code=403, detail="프로파일링 권한이 없습니다.")
+
+
+def _classify_priority(input_params: BaseModel) -> RequestPriority:
+    """입력의 예상 비용에 따라 우선순위 클래스를 결정합니다."""
+    if isinstance(input_params, CPUArchitectureInput) and input_params.trace_file:
+        return RequestPriority.BATCH
+    return RequestPriority.INTERACTIVE
+
+
+async def _run_admitted(
+    simulator_type: SimulatorType,
+    input_params: BaseModel,
+    sampling: Optional[SamplingConfig],
+    fn: Callable[[], Awaitable[Any]],
+    coalesce: bool = True,
+) -> Any:
+    """동일 입력 병합 후 수락 제어를 거쳐 시뮬레이션을 실행합니다."""
+    priority = _classify_priority(input_params)
+    if not coalesce:
+        return await admission.run(priority, fn)
+
+    key = f"{simulator_type.value}:{input_params.model_dump_json()}"
+    if sampling is not None:
+        key = f"{key}:{sampling.model_dump_json()}"
+    return await single_flight.do(key, lambda: admission.run(priority, fn))
 
 
 def _build_cpu_input_from_params(params: Dict[str, Any]) -> CPUArchitectureInput:
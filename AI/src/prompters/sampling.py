@@ -0,0 +1,165 @@
+"""표본 기반 시뮬레이션을 위한 온라인 통계와 적응형 종료.
+
+샘플은 배치 단위로 생성되며 각 배치는 (개수, 평균, 편차제곱합)으로만 요약되어
+Welford/Chan 방식으로 누적됩니다. 개별 샘플은 저장하지 않습니다.
+"""
+
+import math
+import random
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Tuple
+
+from .schemas import ConfidenceInterval, SamplingConfig
+
+# 배치 요약: (샘플 수, 평균, 편차제곱합)
+BatchSummary = Tuple[int, float, float]
+
+# 요청 하나에서 생성할 최대 배치 수 (배치마다 파이썬 반복이 필요하므로
+# max_samples / batch_size가 이보다 크면 배치 크기를 키움)
+MAX_SAMPLING_BATCHES = 1_000
+
+
+class OnlineStats:
+    """평균과 분산을 온라인으로 추정합니다 (배치 병합 지원)."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.merge((1, x, 0.0))
+
+    def merge(self, batch: BatchSummary) -> None:
+        """배치 요약을 병합합니다 (Chan et al. 병렬 알고리즘)."""
+        n_b, mean_b, m2_b = batch
+        if n_b == 0:
+            return
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    @property
+    def variance(self) -> float:
+        """표본 분산."""
+        return self.m2 / (self.n - 1) if self.n > 1 else math.inf
+
+    def half_width(self, z: float) -> float:
+        """평균의 신뢰구간 반폭."""
+        if self.n < 2:
+            return math.inf
+        return z * math.sqrt(self.variance / self.n)
+
+    def interval(
+        self, confidence_level: float, target_half_width: Optional[float] = None
+    ) -> ConfidenceInterval:
+        """평균의 신뢰구간을 반환합니다. 목표 반폭이 주어지면 달성 여부를 함께 기록합니다."""
+        half = self.half_width(z_value(confidence_level))
+        return ConfidenceInterval(
+            mean=self.mean,
+            lower=self.mean - half,
+            upper=self.mean + half,
+            half_width=half,
+            confidence_level=confidence_level,
+            samples=self.n,
+            target_half_width=target_half_width,
+            target_met=half <= target_half_width if target_half_width is not None else None,
+        )
+
+
+def z_value(confidence_level: float) -> float:
+    """양측 신뢰수준에 해당하는 표준정규 분위수."""
+    return NormalDist().inv_cdf((1 + confidence_level) / 2)
+
+
+def bernoulli_summary(successes: int, trials: int, scale: float = 100.0) -> BatchSummary:
+    """
+    0/1 샘플 배치의 요약 (개수, 평균, 편차제곱합).
+
+    scale은 보고 단위 변환 계수입니다 (기본값 100: 비율 → %).
+    """
+    if trials == 0:
+        return (0, 0.0, 0.0)
+    mean = successes / trials
+    return (trials, mean * scale, successes * (1 - mean) * scale * scale)
+
+
+def binomial(rng: random.Random, n: int, p: float) -> int:
+    """이항분포 난수 (개별 시행을 생성하지 않음)."""
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    binomialvariate = getattr(rng, "binomialvariate", None)  # Python 3.12+
+    if binomialvariate is not None:
+        return binomialvariate(n, p)
+    if p > 0.5:
+        return n - binomial(rng, n, 1.0 - p)
+    if n * p >= 30:
+        # 정규 근사
+        k = round(rng.gauss(n * p, math.sqrt(n * p * (1 - p))))
+        return min(n, max(0, k))
+    # 기하분포 대기 시간으로 성공 위치만 생성 (기대 반복 n·p회)
+    log_q = math.log(1.0 - p)
+    k = 0
+    position = 0
+    while True:
+        position += int(math.log(1.0 - rng.random()) / log_q) + 1
+        if position > n:
+            return k
+        k += 1
+
+
+def run_sampling(
+    sampling: SamplingConfig,
+    draw_batch: Callable[[random.Random, int], Dict[str, BatchSummary]],
+    default_metric: str,
+) -> Dict[str, ConfidenceInterval]:
+    """
+    배치를 반복 생성하여 지표별 온라인 통계를 누적하고 신뢰구간을 반환합니다.
+
+    목표 반폭(target_half_width)이 지정되면 대상 지표의 신뢰구간 반폭이
+    목표 이하가 될 때 종료하고, 없으면 max_samples만큼 샘플링합니다.
+    목표 전에 max_samples에 도달하면 대상 지표의 target_met이 False가 됩니다.
+    배치 수는 MAX_SAMPLING_BATCHES를 넘지 않습니다.
+    샘플이 2개 미만인 지표는 분산을 추정할 수 없으므로 결과에서 제외합니다
+    (반폭이 무한대가 되어 JSON으로 직렬화할 수 없음).
+
+    Args:
+        sampling: 샘플링 설정
+        draw_batch: (난수 생성기, 배치 크기) -> 지표별 배치 요약. 요약 값은 보고 단위 기준
+        default_metric: target_metric이 없을 때의 대상 지표
+    """
+    rng = random.Random(sampling.seed)
+    metric = sampling.target_metric or default_metric
+    z = z_value(sampling.confidence_level)
+    batch_size = max(sampling.batch_size, math.ceil(sampling.max_samples / MAX_SAMPLING_BATCHES))
+    stats: Dict[str, OnlineStats] = {}
+    drawn = 0
+
+    while drawn < sampling.max_samples:
+        size = min(batch_size, sampling.max_samples - drawn)
+        for name, summary in draw_batch(rng, size).items():
+            stats.setdefault(name, OnlineStats()).merge(summary)
+        drawn += size
+
+        if metric not in stats:
+            raise ValueError(f"신뢰구간을 계산할 수 없는 지표입니다: {metric}")
+        if (
+            sampling.target_half_width is not None
+            and stats[metric].half_width(z) <= sampling.target_half_width
+        ):
+            break
+
+    return {
+        name: stat.interval(
+            sampling.confidence_level,
+            sampling.target_half_width if name == metric else None,
+        )
+        for name, stat in stats.items()
+        if stat.n >= 2
+    }
@@ -1,7 +1,7 @@
 """Pydantic schemas for simulation parameters."""
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, model_validator
 from .enums import (
     SimulatorType,
     PrefetcherType,
@@ -9,6 +9,38 @@ from .enums import (
     TechnologyNode,
     LithographySource,
 )
+from .normalize import MAX_CACHE_LATENCY, NormalizedCacheConfig, normalize_cache
+
+
+# ==================== Sampling & Confidence Intervals ====================
+
+
+class SamplingConfig(BaseModel):
+    """표본 기반 시뮬레이션 설정."""
+    confidence_level: float = Field(default=0.95, description="신뢰수준", gt=0.5, lt=1.0)
+    target_half_width: Optional[float] = Field(
+        None, description="목표 신뢰구간 반폭 (지표 단위, 예: 0.1 → ±0.1%p). 없으면 max_samples만큼 샘플링", gt=0.0
+    )
+    target_metric: Optional[str] = Field(
+        None, description="목표 정밀도를 적용할 지표 (기본값: CPU는 l1_hit_rate, 파브는 functional_yield)"
+    )
+    batch_size: int = Field(default=10_000, description="배치당 샘플 수", ge=100, le=1_000_000)
+    max_samples: int = Field(default=1_000_000, description="최대 샘플 수", ge=100, le=100_000_000)
+    seed: Optional[int] = Field(None, description="난수 시드")
+
+
+class ConfidenceInterval(BaseModel):
+    """지표의 신뢰구간."""
+    mean: float = Field(..., description="추정 평균")
+    lower: float = Field(..., description="하한")
+    upper: float = Field(..., description="상한")
+    half_width: float = Field(..., description="반폭")
+    confidence_level: float = Field(..., description="신뢰수준")
+    samples: int = Field(..., description="사용된 샘플 수")
+    target_half_width: Optional[float] = Field(None, description="목표 반폭 (목표 정밀도를 적용한 지표만)")
+    target_met: Optional[bool] = Field(
+        None, description="목표 반폭 달성 여부 (false면 max_samples에 도달하여 목표 전에 종료됨)"
+    )
 
 
 # ==================== CPU Architecture & Cache Simulator ====================
@@ -19,7 +51,23 @@ class CacheConfig(BaseModel):
     size: str = Field(..., description="캐시 크기 (예: '32KB', '256KB')")
     associativity: int = Field(..., description="연관도 (way 수)")
     block_size: int = Field(default=64, description="블록 크기 (Bytes)")
-    latency: int = Field(..., description="지연 시간 (Cycles)")
+    latency: int = Field(..., description="지연 시간 (Cycles)", ge=0, le=MAX_CACHE_LATENCY)
+    
+    @model_validator(mode="after")
+    def _check_geometry(self) -> "CacheConfig":
+        """크기/연관도/블록 크기 교차 검증 (세트 수는 2의 거듭제곱)."""
+        normalize_cache(self.size, self.associativity, self.block_size, self.latency)
+        return self
+    
+    @property
+    def normalized(self) -> NormalizedCacheConfig:
+        """
+        정규화된 내부 설정 (바이트 크기, 세트/웨이 수, 오프셋 비트 수).
+
+        인스턴스에 저장하지 않고 현재 필드 값으로 매번 조회합니다 (normalize_cache가
+        조합별로 캐시하므로 비용이 작고, model_copy(update=...) 후에도 값이 맞음).
+        """
+        return normalize_cache(self.size, self.associativity, self.block_size, self.latency)
 
 
 class L1CacheConfig(CacheConfig):
@@ -64,6 +112,19 @@ class CPUArchitectureInput(BaseModel):
     trace_file: Optional[str] = Field(None, description="메모리 접근 기록 파일")
 
 
+class EnergyBreakdown(BaseModel):
+    """에너지 분해 결과 (Joules)."""
+    core_dynamic: float = Field(..., description="코어 동적 에너지 (J)")
+    cache_dynamic: float = Field(..., description="캐시 접근 동적 에너지 (J)")
+    dram: float = Field(..., description="DRAM 접근 에너지 (J)")
+    bus: float = Field(..., description="오프칩 버스 전송 에너지 (J)")
+    leakage: float = Field(..., description="누설 에너지 (J)")
+
+    @property
+    def total(self) -> float:
+        return self.core_dynamic + self.cache_dynamic + self.dram + self.bus + self.leakage
+
+
 class CPUArchitectureOutput(BaseModel):
     """CPU 아키텍처 시뮬레이터 출력 파라미터."""
     # Performance
@@ -84,7 +145,13 @@ class CPUArchitectureOutput(BaseModel):
     
     # Energy
     total_energy: float = Field(..., description="총 에너지 (Joules)")
-    edp: float = Field(..., description="Energy-Delay Product")
+    edp: float = Field(..., description="Energy-Delay Product (J·s)")
+    energy_breakdown: Optional[EnergyBreakdown] = Field(None, description="에너지 분해 결과")
+    
+    # Sampling
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = Field(
+        None, description="지표별 신뢰구간 (샘플링 실행 시)"
+    )
 
 
 # ==================== Semiconductor Fab & Yield Simulator ====================
@@ -121,6 +188,9 @@ class BinningDistribution(BaseModel):
     grade_a: float = Field(..., description="최고 등급 비율 (%)")
     grade_b: float = Field(..., description="중간 등급 비율 (%)")
     grade_c: float = Field(..., description="하위 등급 비율 (%)")
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = Field(
+        None, description="등급별 신뢰구간 (샘플링 실행 시)"
+    )
 
 
 class SemiconductorFabOutput(BaseModel):
@@ -138,6 +208,33 @@ class SemiconductorFabOutput(BaseModel):
     # Economics & Strategy
     mask_amortization_cost: float = Field(..., description="마스크 상각비 (Currency)")
     line_balance_efficiency: float = Field(..., description="라인 밸런싱 효율 (%)")
+    
+    # Sampling
+    confidence_intervals: Optional[Dict[str, ConfidenceInterval]] = Field(
+        None, description="지표별 신뢰구간 (샘플링 실행 시)"
+    )
+
+
+# ==================== Profiling ====================
+
+
+class StageProfile(BaseModel):
+    """단계별 프로파일 결과."""
+    name: str = Field(..., description="단계 이름")
+    wall_ms: float = Field(..., description="경과 시간 (ms)")
+    cpu_ms: float = Field(..., description="CPU 시간 (ms)")
+    allocated_blocks: int = Field(..., description="새로 할당된 메모리 블록 수 (tracemalloc)")
+    allocated_bytes: int = Field(..., description="새로 할당된 바이트 (tracemalloc)")
+    peak_bytes: int = Field(..., description="단계 중 최대 추가 메모리 사용량 (bytes)")
+
+
+class ProfileSummary(BaseModel):
+    """요청 프로파일 요약."""
+    profile_id: str = Field(..., description="프로파일 ID")
+    wall_ms: float = Field(..., description="전체 경과 시간 (ms)")
+    sample_count: int = Field(..., description="수집된 스택 샘플 수")
+    stages: List[StageProfile] = Field(default_factory=list, description="단계별 결과")
+    download_url: str = Field(..., description="아티팩트 다운로드 경로 (?format=speedscope|collapsed)")
 
 
 # ==================== Request/Response Schemas ====================
@@ -149,6 +246,8 @@ class SimulationRequest(BaseModel):
     user_message: str = Field(..., description="사용자 자연어 메시지")
     cpu_input: Optional[CPUArchitectureInput] = Field(None, description="CPU 시뮬레이터 입력 (타입이 cpu_architecture일 때)")
     fab_input: Optional[SemiconductorFabInput] = Field(None, description="파브 시뮬레이터 입력 (타입이 semiconductor_fab일 때)")
+    sampling: Optional[SamplingConfig] = Field(None, description="표본 기반 실행 설정 (없으면 결정론적 실행)")
+    profile: bool = Field(default=False, description="프로파일링 실행 여부 (디버그 모드 또는 관리자 토큰 필요)")
 
 
 class SimulationResponse(BaseModel):
@@ -158,4 +257,77 @@ class SimulationResponse(BaseModel):
     cpu_output: Optional[CPUArchitectureOutput] = None
     fab_output: Optional[SemiconductorFabOutput] = None
     extracted_params: dict = Field(default_factory=dict, description="추출된 파라미터")
+    profile: Optional[ProfileSummary] = Field(None, description="프로파일 요약 (profile=true일 때)")
+
+
+class CPUSweepRequest(BaseModel):
+    """CPU 설계 공간 스윕 요청."""
+    # 행 단위 모델 검증을 건너뛰고 validation.validate_cpu_rows로 일괄 검증함
+    cpu_inputs: List[Dict[str, Any]] = Field(
+        ...,
+        description="스윕할 CPU 구성 목록 (CPUArchitectureInput 형식, 최대 10,000개)",
+        min_length=1,
+        max_length=10_000,
+    )
+
+
+class CPUSweepResponse(BaseModel):
+    """CPU 설계 공간 스윕 응답."""
+    cpu_outputs: List[CPUArchitectureOutput] = Field(..., description="입력 순서와 같은 시뮬레이션 결과")
+
+
+class ComparisonRequest(BaseModel):
+    """시나리오 비교 요청 (기준안 + 변형안 N개)."""
+    simulator_type: SimulatorType = Field(..., description="시뮬레이터 타입")
+    cpu_baseline: Optional[CPUArchitectureInput] = Field(None, description="CPU 기준안 (타입이 cpu_architecture일 때)")
+    cpu_variants: List[CPUArchitectureInput] = Field(default_factory=list, description="CPU 변형안 목록", max_length=32)
+    fab_baseline: Optional[SemiconductorFabInput] = Field(None, description="파브 기준안 (타입이 semiconductor_fab일 때)")
+    fab_variants: List[SemiconductorFabInput] = Field(default_factory=list, description="파브 변형안 목록", max_length=32)
 
+    @model_validator(mode="after")
+    def _check_scenarios(self) -> "ComparisonRequest":
+        """선택한 타입의 기준안과 변형안 1개 이상이 필요하고, 다른 타입의 입력은 허용하지 않습니다."""
+        if self.simulator_type == SimulatorType.CPU_ARCHITECTURE:
+            baseline, variants, prefix, other = self.cpu_baseline, self.cpu_variants, "cpu", "fab"
+        else:
+            baseline, variants, prefix, other = self.fab_baseline, self.fab_variants, "fab", "cpu"
+        if baseline is None:
+            raise ValueError(f"{prefix}_baseline이 필요합니다.")
+        if not variants:
+            raise ValueError(f"비교할 {prefix}_variants가 1개 이상 필요합니다.")
+        if getattr(self, f"{other}_baseline") is not None or getattr(self, f"{other}_variants"):
+            raise ValueError(
+                f"simulator_type이 {self.simulator_type.value}이면 {other}_baseline/{other}_variants를 지정할 수 없습니다."
+            )
+        return self
+
+
+class MetricDelta(BaseModel):
+    """기준안 대비 지표 변화."""
+    value: float = Field(..., description="시나리오 값")
+    delta: float = Field(..., description="기준안 대비 차이")
+    delta_percent: Optional[float] = Field(None, description="기준안 대비 변화율 (%), 기준값이 0이면 없음")
+
+
+class MetricRanking(BaseModel):
+    """지표별 시나리오 순위."""
+    metric: str = Field(..., description="지표 이름")
+    higher_is_better: bool = Field(..., description="값이 클수록 좋은 지표인지 여부")
+    ranking: List[int] = Field(..., description="시나리오 인덱스 (좋은 순서, 0 = 기준안)")
+
+
+class ScenarioResult(BaseModel):
+    """시나리오 하나의 결과."""
+    index: int = Field(..., description="시나리오 인덱스 (0 = 기준안, 1..N = 변형안)")
+    name: str = Field(..., description="시나리오 이름")
+    cpu_output: Optional[CPUArchitectureOutput] = None
+    fab_output: Optional[SemiconductorFabOutput] = None
+    deltas: Dict[str, MetricDelta] = Field(default_factory=dict, description="지표별 기준안 대비 변화")
+
+
+class ComparisonResponse(BaseModel):
+    """시나리오 비교 응답."""
+    simulator_type: SimulatorType
+    message: str = Field(..., description="비교 요약 메시지")
+    scenarios: List[ScenarioResult] = Field(..., description="기준안과 변형안 결과")
+    rankings: List[MetricRanking] = Field(..., description="지표별 순위")
@@ -0,0 +1,272 @@
+"""스윕 배치용 대량 검증 경로.
+
+행마다 Pydantic 검증을 돌리는 대신, CPUArchitectureInput의 필드 제약(ge/le, 타입,
+기본값)을 모듈 로드 시 한 번 컴파일해 두고 원시 dict 행을 직접 검사합니다.
+캐시 설정은 (size, associativity, block_size, latency) 조합별로 한 번만 정규화되며,
+검증을 통과한 행은 model_construct로 재검증 없이 모델을 만듭니다.
+"""
+
+import enum
+import math
+import re
+import typing
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from annotated_types import Ge, Le
+from pydantic import BaseModel
+
+from .normalize import normalize_cache
+from .schemas import CacheConfig, CPUArchitectureInput
+
+# 오류 보고 최대 개수
+MAX_REPORTED_ERRORS = 100
+# 재사용할 캐시 설정 인스턴스 최대 개수 (타입별)
+MAX_CACHED_CACHE_CONFIGS = 4096
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class RowError:
+    """행 검증 오류."""
+    index: int
+    field: str
+    message: str
+
+
+class SweepValidationError(ValueError):
+    """스윕 배치에 잘못된 행이 있을 때 발생하는 예외."""
+
+    def __init__(self, errors: List[RowError], total: int):
+        self.errors = errors
+        self.total = total
+        super().__init__(f"잘못된 스윕 행 {total}개")
+
+    def to_detail(self) -> List[Dict[str, Any]]:
+        return [
+            {"index": e.index, "field": e.field, "message": e.message} for e in self.errors
+        ]
+
+
+# ==================== 필드 검사기 컴파일 ====================
+
+# 검사기: 값 -> 변환된 값 (실패 시 ValueError)
+Checker = Callable[[Any], Any]
+
+
+def _bounded(cast: Checker, lo: Optional[float], hi: Optional[float]) -> Checker:
+    def check(value: Any) -> Any:
+        value = cast(value)
+        if lo is not None and value < lo:
+            raise ValueError(f"{lo} 이상이어야 합니다 (입력값: {value})")
+        if hi is not None and value > hi:
+            raise ValueError(f"{hi} 이하여야 합니다 (입력값: {value})")
+        return value
+    return check
+
+
+# Pydantic(lax 모드)이 정수로 받아들이는 문자열: 앞뒤 공백, 부호, 밑줄 구분, ".0" 접미사 허용
+_INT_STRING = re.compile(r"[+-]?[0-9]+(?:_[0-9]+)*(?:\.0+)?")
+
+
+def _as_int(value: Any) -> int:
+    # bool은 int의 하위 타입이며 Pydantic도 True/False를 1/0으로 받아들임
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if _INT_STRING.fullmatch(text):
+            return int(text.split(".")[0])
+    raise ValueError(f"정수여야 합니다 (입력값: {value!r})")
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        result = float(value)
+    elif isinstance(value, str):
+        try:
+            result = float(value)
+        except ValueError:
+            raise ValueError(f"실수여야 합니다 (입력값: {value!r})") from None
+    else:
+        raise ValueError(f"실수여야 합니다 (입력값: {value!r})")
+    # NaN은 모든 비교가 거짓이라 범위 검사를 통과해 버리므로 먼저 거부함
+    # (범위 제약이 있는 필드에서 Pydantic도 NaN/무한대를 거부함)
+    if not math.isfinite(result):
+        raise ValueError(f"유한한 실수여야 합니다 (입력값: {value!r})")
+    return result
+
+
+def _as_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"문자열이어야 합니다 (입력값: {value!r})")
+    return value
+
+
+def _as_enum(enum_type: Type[enum.Enum]) -> Checker:
+    members = {member.value: member for member in enum_type}
+
+    def check(value: Any) -> enum.Enum:
+        if isinstance(value, enum_type):
+            return value
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{sorted(members)} 중 하나여야 합니다 (입력값: {value!r})")
+    return check
+
+
+def _as_cache(model: Type[CacheConfig]) -> Checker:
+    # 기하 검증(_check_geometry)은 아래 normalize_cache 호출로 대신함
+    plan = _compile(model, replicated_validators={"_check_geometry"})
+    # 스윕 행들은 소수의 캐시 설정을 공유하므로 같은 설정은 인스턴스를 재사용함
+    # (엔진은 입력 모델을 변경하지 않음)
+    constructed: Dict[Tuple[Tuple[str, Any], ...], CacheConfig] = {}
+
+    def check(value: Any) -> CacheConfig:
+        if isinstance(value, model):
+            return value
+        if not isinstance(value, dict):
+            raise ValueError("객체여야 합니다")
+        try:
+            key = tuple((k, type(v), v) for k, v in value.items())
+            cache = constructed.get(key)
+        except TypeError:  # 해시할 수 없는 값
+            key, cache = None, None
+        if cache is not None:
+            return cache
+
+        fields = _apply(plan, value)
+        normalize_cache(
+            fields["size"], fields["associativity"], fields["block_size"], fields["latency"]
+        )
+        cache = model.model_construct(**fields)
+        if key is not None:
+            if len(constructed) >= MAX_CACHED_CACHE_CONFIGS:
+                constructed.clear()
+            constructed[key] = cache
+        return cache
+    return check
+
+
+def _checker_for(annotation: Any, metadata: List[Any]) -> Tuple[Checker, bool]:
+    """필드 타입/제약으로 검사기를 만듭니다. (검사기, None 허용 여부)를 반환합니다."""
+    nullable = False
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        nullable = len(args) < len(typing.get_args(annotation))
+        annotation = args[0]
+
+    # 컴파일하지 않은 제약을 조용히 건너뛰면 model_validate와 결과가 달라지므로 거부함
+    unsupported = [m for m in metadata if not isinstance(m, (Ge, Le))]
+    if unsupported:
+        raise TypeError(f"대량 검증을 지원하지 않는 필드 제약입니다: {unsupported}")
+    lo = next((m.ge for m in metadata if isinstance(m, Ge)), None)
+    hi = next((m.le for m in metadata if isinstance(m, Le)), None)
+
+    if isinstance(annotation, type) and issubclass(annotation, CacheConfig):
+        return _as_cache(annotation), nullable
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return _as_enum(annotation), nullable
+    if annotation is int:
+        return _bounded(_as_int, lo, hi), nullable
+    if annotation is float:
+        return _bounded(_as_float, lo, hi), nullable
+    if annotation is str:
+        return _as_str, nullable
+    raise TypeError(f"대량 검증을 지원하지 않는 필드 타입입니다: {annotation}")
+
+
+# (필드명, 검사기, None 허용, 필수 여부, 기본값)
+_Plan = List[Tuple[str, Checker, bool, bool, Any]]
+
+
+def _compile(
+    model: Type[BaseModel], replicated_validators: AbstractSet[str] = frozenset()
+) -> _Plan:
+    """
+    모델 필드 정의로부터 검사 계획을 만듭니다.
+
+    Raises:
+        TypeError: 검사 계획으로 재현할 수 없는 필드 타입, 제약 또는 검증기가 있는 경우
+            (replicated_validators에 있는 검증기는 호출자가 따로 재현함)
+    """
+    decorators = model.__pydantic_decorators__
+    validators = {
+        *decorators.validators,
+        *decorators.field_validators,
+        *decorators.root_validators,
+        *decorators.model_validators,
+    }
+    unsupported = sorted(validators - set(replicated_validators))
+    if unsupported:
+        raise TypeError(f"대량 검증을 지원하지 않는 검증기입니다: {model.__name__}.{unsupported}")
+
+    plan = []
+    for name, info in model.model_fields.items():
+        try:
+            checker, nullable = _checker_for(info.annotation, info.metadata)
+        except TypeError as e:
+            raise TypeError(f"{model.__name__}.{name}: {e}") from None
+        required = info.is_required()
+        plan.append((name, checker, nullable, required, None if required else info.default))
+    return plan
+
+
+def _apply(plan: _Plan, row: Dict[str, Any]) -> Dict[str, Any]:
+    """행에 검사 계획을 적용합니다. 첫 오류에서 (필드명, 메시지) ValueError를 발생시킵니다."""
+    values = {}
+    for name, checker, nullable, required, default in plan:
+        value = row.get(name, _MISSING)
+        if value is _MISSING:
+            if required:
+                raise ValueError(name, "필수 필드입니다")
+            values[name] = default
+            continue
+        if value is None and nullable:
+            values[name] = None
+            continue
+        try:
+            values[name] = checker(value)
+        except ValueError as e:
+            # 중첩 필드 오류는 경로를 이어 붙임
+            if len(e.args) == 2:
+                raise ValueError(f"{name}.{e.args[0]}", e.args[1])
+            raise ValueError(name, str(e))
+    return values
+
+
+_CPU_PLAN = _compile(CPUArchitectureInput)
+
+
+def validate_cpu_rows(rows: Sequence[Any]) -> List[CPUArchitectureInput]:
+    """
+    스윕 행들을 한 번에 검증하여 CPUArchitectureInput 목록으로 변환합니다.
+
+    이미 모델인 행은 그대로 사용합니다.
+
+    Raises:
+        SweepValidationError: 잘못된 행이 하나 이상 있는 경우 (최대 MAX_REPORTED_ERRORS개 보고)
+    """
+    inputs: List[CPUArchitectureInput] = []
+    errors: List[RowError] = []
+    total = 0
+    for index, row in enumerate(rows):
+        if isinstance(row, CPUArchitectureInput):
+            inputs.append(row)
+            continue
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("", "객체여야 합니다")
+            inputs.append(CPUArchitectureInput.model_construct(**_apply(_CPU_PLAN, row)))
+        except ValueError as e:
+            total += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                field, message = e.args if len(e.args) == 2 else ("", str(e))
+                errors.append(RowError(index, field, message))
+    if errors:
+        raise SweepValidationError(errors, total)
+    return inputs
@@ -17,6 +17,25 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
     
+    # 수락 제어 설정
+    rate_limit_per_second: float = 5.0  # 클라이언트당 초당 요청 수
+    rate_limit_burst: int = 20  # 클라이언트당 순간 최대 요청 수
+    max_concurrent_simulations: int = 8
+    max_queued_simulations: int = 32
+    admission_queue_timeout: float = 2.0  # 대기열 최대 대기 시간 (초)
+    trusted_proxies: str = ""  # X-Forwarded-For를 신뢰할 프록시 주소/대역 목록 (예: "10.0.0.1,10.1.0.0/16")
+
+    # 분산 스윕 설정
+    sweep_workers: str = ""  # 워커 주소 목록 (예: "10.0.0.2:9101,10.0.0.3:9101"), 비어 있으면 로컬 실행
+    sweep_unit_size: int = 64  # 작업 단위당 행 수
+    sweep_unit_timeout: float = 60.0  # 작업 단위 응답 대기 시간 (초)
+    sweep_worker_token: Optional[str] = None  # 워커 인증용 공유 비밀 (워커와 같은 값)
+
+    # 프로파일링 설정 (debug 모드이거나 X-Admin-Token이 일치할 때만 허용)
+    admin_token: Optional[str] = None
+    profile_sample_interval: float = 0.005  # 스택 샘플링 간격 (초)
+    max_stored_profiles: int = 20
+
     # LLM 설정 (향후 확장용)
     llm_provider: Optional[str] = None
     llm_api_key: Optional[str] = None
@@ -0,0 +1,155 @@
+"""수락 제어 테스트 (서버 없이 앱을 직접 호출).
+
+실행: python -m pytest -q test_admission.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from main import app  # noqa: E402
+from prompters import evaluation, routes  # noqa: E402
+from prompters.admission import (  # noqa: E402
+    AdmissionController,
+    RateLimiter,
+    SingleFlight,
+    parse_trusted_proxies,
+    resolve_client_ip,
+)
+
+URL = "/api/v1/simulate/"
+
+
+def _cpu_payload(clock_frequency: float = 3.2) -> dict:
+    cpu_input = routes._build_cpu_input_from_params({"clock_frequency": clock_frequency})
+    return {
+        "simulator_type": "cpu_architecture",
+        "user_message": "테스트",
+        "cpu_input": cpu_input.model_dump(mode="json"),
+    }
+
+
+class _SlowEngine:
+    """evaluation._run_cpu를 호출 횟수를 세는 느린 버전으로 바꿉니다."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._original = evaluation._run_cpu
+
+    def __enter__(self) -> "_SlowEngine":
+        def slow_run_cpu(input_params, sampling):
+            with self._lock:
+                self.calls += 1
+            time.sleep(self.delay)
+            return self._original(input_params, sampling)
+        evaluation._run_cpu = slow_run_cpu
+        return self
+
+    def __exit__(self, *exc) -> None:
+        evaluation._run_cpu = self._original
+
+
+def _configure(rate: float, burst: int, max_concurrent: int, max_queued: int, timeout: float) -> None:
+    routes.rate_limiter = RateLimiter(rate, burst)
+    routes.admission = AdmissionController(max_concurrent, max_queued, timeout)
+    routes.single_flight = SingleFlight()
+
+
+async def _post_many(payloads, headers=None):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.post(URL, json=payload, headers=headers) for payload in payloads)
+        )
+
+
+def test_identical_requests_are_coalesced():
+    """동시에 들어온 동일 요청은 엔진을 한 번만 호출합니다."""
+    _configure(1000, 1000, 8, 32, 5.0)
+    with _SlowEngine(0.3) as engine:
+        responses = asyncio.run(_post_many([_cpu_payload()] * 30))
+    assert [r.status_code for r in responses] == [200] * 30
+    assert engine.calls == 1
+    assert len({r.json()["cpu_output"]["ipc"] for r in responses}) == 1
+
+
+def test_overload_returns_503_with_retry_after():
+    """슬롯과 대기열이 가득 차면 503과 Retry-After를 반환합니다."""
+    _configure(1000, 1000, 1, 2, 0.2)
+    payloads = [_cpu_payload(1.0 + i * 0.1) for i in range(6)]
+    with _SlowEngine(0.5) as engine:
+        responses = asyncio.run(_post_many(payloads))
+    codes = [r.status_code for r in responses]
+    assert codes.count(200) >= 1
+    rejected = [r for r in responses if r.status_code == 503]
+    assert rejected
+    assert all(int(r.headers["retry-after"]) >= 1 for r in rejected)
+    assert engine.calls == codes.count(200)
+
+
+def test_rate_limit_returns_429_with_retry_after():
+    """클라이언트별 한도를 넘으면 429와 Retry-After를 반환합니다."""
+    _configure(1, 3, 8, 32, 5.0)
+    responses = asyncio.run(_post_many([_cpu_payload()] * 6))
+    codes = [r.status_code for r in responses]
+    assert codes.count(429) == 3
+    assert all("retry-after" in r.headers for r in responses if r.status_code == 429)
+
+
+def test_forwarded_for_is_ignored_from_untrusted_peer():
+    """신뢰 프록시가 아닌 클라이언트는 X-Forwarded-For를 바꿔도 한도를 우회할 수 없습니다."""
+    _configure(1, 3, 8, 32, 5.0)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [
+                await client.post(URL, json=_cpu_payload(), headers={"X-Forwarded-For": f"10.9.0.{i}"})
+                for i in range(6)
+            ]
+
+    codes = [r.status_code for r in asyncio.run(run())]
+    assert codes.count(429) == 3
+
+
+def test_resolve_client_ip():
+    trusted = parse_trusted_proxies("127.0.0.1, 10.1.0.0/16")
+    # 신뢰하지 않는 상대: 헤더 무시
+    assert resolve_client_ip("203.0.113.5", "1.2.3.4", trusted) == "203.0.113.5"
+    # 신뢰 프록시 뒤: 오른쪽부터 신뢰 프록시를 건너뛴 첫 주소
+    assert resolve_client_ip("127.0.0.1", "6.6.6.6, 198.51.100.7, 10.1.2.3", trusted) == "198.51.100.7"
+    assert resolve_client_ip("127.0.0.1", None, trusted) == "127.0.0.1"
+    assert resolve_client_ip(None, "1.2.3.4", trusted) == "unknown"
+
+
+def test_single_flight_survives_leader_cancellation():
+    """먼저 온 요청이 취소되어도 병합된 요청은 결과를 받습니다."""
+    async def run():
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        assert leader.cancelled()
+        assert flight.inflight_count == 0
+        return calls, result
+
+    assert asyncio.run(run()) == (1, "done")
@@ -0,0 +1,88 @@
+"""단계별 체크포인트 캐시 테스트.
+
+실행: python -m pytest -q test_checkpoint.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from prompters import evaluation  # noqa: E402
+from prompters.routes import _build_cpu_input_from_params, _build_fab_input_from_params  # noqa: E402
+from prompters.schemas import SamplingConfig  # noqa: E402
+
+
+def _stats(cache):
+    stats = cache.stats()
+    return stats["hits"], stats["misses"]
+
+
+def _cold_cpu(cpu_input, sampling=None):
+    """캐시를 비운 상태에서 실행한 결과."""
+    evaluation._hierarchy_cache.clear()
+    return evaluation._run_cpu(cpu_input, sampling)
+
+
+def _cold_fab(fab_input, sampling=None):
+    evaluation._yield_cache.clear()
+    return evaluation._run_fab(fab_input, sampling)
+
+
+def test_memory_latency_edit_reuses_hierarchy_stage():
+    base = _build_cpu_input_from_params({"l3_size": "8MB"})
+    edited = [
+        base.model_copy(update={"main_memory_latency": 300}),
+        base.model_copy(update={
+            "l3_cache_config": base.l3_cache_config.model_copy(update={"latency": 60}),
+        }),
+    ]
+
+    evaluation._hierarchy_cache.clear()
+    evaluation._run_cpu(base, None)
+    assert _stats(evaluation._hierarchy_cache) == (0, 1)
+    outputs = [evaluation._run_cpu(cpu_input, None) for cpu_input in edited]
+    assert _stats(evaluation._hierarchy_cache) == (2, 1)
+
+    for cpu_input, output in zip(edited, outputs):
+        assert output.model_dump() == _cold_cpu(cpu_input).model_dump()
+
+
+def test_cache_geometry_edit_misses_hierarchy_stage():
+    base = _build_cpu_input_from_params({"l3_size": "8MB"})
+    evaluation._hierarchy_cache.clear()
+    evaluation._run_cpu(base, None)
+    evaluation._run_cpu(base.model_copy(update={
+        "l3_cache_config": base.l3_cache_config.model_copy(update={"size": "16MB"}),
+    }), None)
+    assert _stats(evaluation._hierarchy_cache) == (0, 2)
+
+
+def test_sampled_run_reuses_hierarchy_stage():
+    base = _build_cpu_input_from_params({"l3_size": "8MB"})
+    sampling = SamplingConfig(batch_size=1000, max_samples=10_000, seed=3)
+    edited = base.model_copy(update={"main_memory_latency": 250})
+
+    evaluation._hierarchy_cache.clear()
+    evaluation._run_cpu(base, sampling)
+    output = evaluation._run_cpu(edited, sampling)
+    assert _stats(evaluation._hierarchy_cache) == (1, 1)
+    assert output.model_dump() == _cold_cpu(edited, sampling).model_dump()
+
+
+def test_mttr_mtbf_edit_reuses_yield_stage():
+    base = _build_fab_input_from_params({})
+    edited = [
+        base.model_copy(update={"mttr": 20.0}),
+        base.model_copy(update={"mtbf": 500.0}),
+        base.model_copy(update={"mttr": 1.0, "mtbf": 5000.0}),
+    ]
+
+    evaluation._yield_cache.clear()
+    evaluation._run_fab(base, None)
+    assert _stats(evaluation._yield_cache) == (0, 1)
+    outputs = [evaluation._run_fab(fab_input, None) for fab_input in edited]
+    assert _stats(evaluation._yield_cache) == (3, 1)
+
+    for fab_input, output in zip(edited, outputs):
+        assert output.model_dump() == _cold_fab(fab_input).model_dump()
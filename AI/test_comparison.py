@@ -0,0 +1,76 @@
+"""시나리오 비교 엔드포인트 테스트.
+
+실행: python -m pytest -q test_comparison.py
+"""
+
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from main import app  # noqa: E402
+from prompters import routes  # noqa: E402
+from prompters.admission import RateLimiter  # noqa: E402
+
+URL = "/api/v1/simulate/compare"
+
+client = TestClient(app)
+
+
+def _cpu(**params) -> dict:
+    return routes._build_cpu_input_from_params(params).model_dump(mode="json")
+
+
+def _fab(**params) -> dict:
+    return routes._build_fab_input_from_params(params).model_dump(mode="json")
+
+
+def setup_function():
+    routes.rate_limiter = RateLimiter(1000, 1000)
+
+
+def test_cpu_comparison_returns_deltas_and_rankings():
+    response = client.post(URL, json={
+        "simulator_type": "cpu_architecture",
+        "cpu_baseline": _cpu(),
+        "cpu_variants": [_cpu(clock_frequency=4.0), _cpu(clock_frequency=2.0)],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert [s["index"] for s in body["scenarios"]] == [0, 1, 2]
+    assert body["scenarios"][0]["deltas"]["total_execution_time"]["delta"] == 0
+    rankings = {r["metric"]: r["ranking"] for r in body["rankings"]}
+    # 클럭이 높을수록 실행 시간이 짧음
+    assert rankings["total_execution_time"] == [1, 0, 2]
+    assert body["message"].startswith("## 시나리오 비교 결과")
+
+
+def test_fab_comparison():
+    response = client.post(URL, json={
+        "simulator_type": "semiconductor_fab",
+        "fab_baseline": _fab(),
+        "fab_variants": [_fab(throughput_wph=150)],
+    })
+    assert response.status_code == 200
+    assert response.json()["scenarios"][1]["fab_output"] is not None
+
+
+def test_inputs_for_other_type_are_rejected():
+    response = client.post(URL, json={
+        "simulator_type": "cpu_architecture",
+        "cpu_baseline": _cpu(),
+        "cpu_variants": [_cpu(clock_frequency=4.0)],
+        "fab_variants": [_fab()],
+    })
+    assert response.status_code == 422
+
+
+def test_missing_baseline_or_variants_are_rejected():
+    for payload in (
+        {"simulator_type": "cpu_architecture", "cpu_baseline": _cpu()},
+        {"simulator_type": "cpu_architecture", "cpu_variants": [_cpu()]},
+        {"simulator_type": "semiconductor_fab", "cpu_baseline": _cpu(), "cpu_variants": [_cpu()]},
+    ):
+        assert client.post(URL, json=payload).status_code == 422, payload
@@ -0,0 +1,254 @@
+"""분산 스윕 테스트 (같은 머신에서 로컬 워커 프로세스 3개 실행).
+
+실행: python -m pytest -q test_distributed.py
+"""
+
+import asyncio
+import functools
+import os
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from main import app  # noqa: E402
+from settings import settings  # noqa: E402
+from prompters import routes  # noqa: E402
+from prompters.admission import RateLimiter  # noqa: E402
+from prompters.distributed import (  # noqa: E402
+    LocalWorker,
+    SweepCoordinator,
+    SweepError,
+    SweepUnitError,
+    spawn_local_workers,
+)
+from prompters.evaluation import SimulatorEngine  # noqa: E402
+from prompters.validation import validate_cpu_rows  # noqa: E402
+
+
+def _sweep_inputs(count: int):
+    return [
+        routes._build_cpu_input_from_params({
+            "number_of_cores": 1 + i % 8,
+            "clock_frequency": 1.0 + (i % 30) * 0.1,
+            "l1_size": ["16KB", "32KB", "64KB"][i % 3],
+        })
+        for i in range(count)
+    ]
+
+
+POISON_TRACE = "poison.trace"
+SLOW_TRACE = "slow.trace"
+SLOW_DELAY = 2.0
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+
+# 스윕 엔진을 바꾼 워커: trace_file이 POISON_TRACE인 행이 있으면 실패하고,
+# SLOW_TRACE인 행이 있으면 처음 한 번만 SLOW_DELAY초 늦게 응답함
+_PATCHED_WORKER = f"""
+import time
+from prompters import evaluation
+from prompters.distributed import main
+
+_run_cpu_sweep = evaluation._run_cpu_sweep
+_delayed = []
+
+def patched(inputs):
+    traces = {{params.trace_file for params in inputs}}
+    if {POISON_TRACE!r} in traces:
+        raise ZeroDivisionError("poisoned row")
+    if {SLOW_TRACE!r} in traces and not _delayed:
+        _delayed.append(True)
+        time.sleep({SLOW_DELAY})
+    return _run_cpu_sweep(inputs)
+
+evaluation._run_cpu_sweep = patched
+main(["worker", "--port", "0"])
+"""
+
+
+def _with_trace(base, trace_file: str):
+    row = base.model_dump(mode="json")
+    row["trace_file"] = trace_file
+    return row
+
+
+async def _spawn_patched_workers(count: int):
+    workers = []
+    for _ in range(count):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", _PATCHED_WORKER,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=SRC_DIR,
+        )
+        line = (await process.stdout.readline()).decode().strip()
+        assert line.startswith("READY "), line
+        workers.append(LocalWorker(process, ("127.0.0.1", int(line.split()[1]))))
+    return workers
+
+
+async def _with_workers(count: int, body, spawn=spawn_local_workers):
+    workers = await spawn(count)
+    try:
+        return await body(workers)
+    finally:
+        for worker in workers:
+            worker.kill()
+        await asyncio.gather(*(worker.wait() for worker in workers))
+
+
+def test_distributed_sweep_matches_local():
+    inputs = _sweep_inputs(500)
+
+    async def body(workers):
+        coordinator = SweepCoordinator([w.address for w in workers], unit_size=16)
+        return await coordinator.run(inputs), await SimulatorEngine.run_cpu_sweep(inputs)
+
+    distributed, local = asyncio.run(_with_workers(3, body))
+    assert [o.model_dump() for o in distributed] == [o.model_dump() for o in local]
+
+
+def test_work_stealing_with_fewer_units_than_workers():
+    inputs = _sweep_inputs(10)
+
+    async def body(workers):
+        coordinator = SweepCoordinator([w.address for w in workers], unit_size=64, steal=True)
+        return await coordinator.run(inputs), await SimulatorEngine.run_cpu_sweep(inputs)
+
+    distributed, local = asyncio.run(_with_workers(3, body))
+    assert [o.model_dump() for o in distributed] == [o.model_dump() for o in local]
+
+
+def test_worker_loss_mid_run_is_retried():
+    inputs = _sweep_inputs(20_000)
+
+    async def body(workers):
+        coordinator = SweepCoordinator([w.address for w in workers], unit_size=50)
+        outputs = {}
+        async for index, output in coordinator.stream(inputs):
+            outputs[index] = output
+            if len(outputs) == 100:
+                workers[0].kill()
+        assert workers[0].process.returncode is not None
+        return [outputs[i] for i in range(len(inputs))], await SimulatorEngine.run_cpu_sweep(inputs)
+
+    distributed, local = asyncio.run(_with_workers(3, body))
+    assert [o.model_dump() for o in distributed] == [o.model_dump() for o in local]
+
+
+def test_poison_row_fails_without_dropping_workers():
+    inputs = _sweep_inputs(100)
+    rows = [row.model_dump(mode="json") for row in inputs]
+    rows[37] = _with_trace(inputs[37], POISON_TRACE)
+
+    async def body(workers):
+        coordinator = SweepCoordinator([w.address for w in workers], unit_size=16)
+        try:
+            await coordinator.run(validate_cpu_rows(rows))
+        except SweepUnitError as e:
+            error = e
+        else:
+            raise AssertionError("SweepUnitError가 발생해야 합니다.")
+        # 워커는 살아 있고 다음 스윕을 정상 처리함
+        assert all(w.process.returncode is None for w in workers)
+        outputs = await coordinator.run(inputs)
+        return error, outputs
+
+    error, outputs = asyncio.run(_with_workers(3, body, _spawn_patched_workers))
+    assert error.start == 32
+    assert "ZeroDivisionError" in error.error
+    assert len(outputs) == len(inputs)
+
+
+def test_sweep_endpoint_reports_poison_row_as_500():
+    inputs = _sweep_inputs(40)
+    rows = [row.model_dump(mode="json") for row in inputs]
+    rows[5] = _with_trace(inputs[5], POISON_TRACE)
+
+    async def body(workers):
+        previous = settings.sweep_workers
+        settings.sweep_workers = ",".join(f"{host}:{port}" for host, port in (w.address for w in workers))
+        routes.rate_limiter = RateLimiter(1000, 1000)
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/api/v1/simulate/sweep", json={"cpu_inputs": rows})
+        finally:
+            settings.sweep_workers = previous
+
+    response = asyncio.run(_with_workers(3, body, _spawn_patched_workers))
+    assert response.status_code == 500
+    assert "ZeroDivisionError" in response.json()["detail"]
+
+
+def test_slow_unit_is_retried_on_the_same_worker():
+    """응답 시간을 넘긴 단위는 재시도되고, 워커는 다시 연결되어 계속 사용됩니다."""
+    inputs = _sweep_inputs(8)
+    rows = [row.model_dump(mode="json") for row in inputs]
+    rows[2] = _with_trace(inputs[2], SLOW_TRACE)
+
+    async def body(workers):
+        coordinator = SweepCoordinator([w.address for w in workers], unit_size=4, unit_timeout=1.0)
+        return await coordinator.run(validate_cpu_rows(rows))
+
+    outputs = asyncio.run(_with_workers(1, body, _spawn_patched_workers))
+    assert len(outputs) == len(inputs)
+
+
+def test_slow_unit_counts_against_attempts():
+    inputs = _sweep_inputs(4)
+    rows = [row.model_dump(mode="json") for row in inputs]
+    rows[0] = _with_trace(inputs[0], SLOW_TRACE)
+
+    async def body(workers):
+        coordinator = SweepCoordinator(
+            [w.address for w in workers], unit_size=4, unit_timeout=1.0, max_attempts=1
+        )
+        await coordinator.run(validate_cpu_rows(rows))
+
+    try:
+        asyncio.run(_with_workers(1, body, _spawn_patched_workers))
+    except SweepError as e:
+        assert "최대 재시도" in str(e)
+    else:
+        raise AssertionError("SweepError가 발생해야 합니다.")
+
+
+def test_workers_reject_wrong_token():
+    inputs = _sweep_inputs(10)
+    spawn = functools.partial(spawn_local_workers, token="s3cret")
+
+    async def body(workers):
+        addresses = [w.address for w in workers]
+        try:
+            await SweepCoordinator(addresses, token="wrong").run(inputs)
+        except SweepError:
+            pass
+        else:
+            raise AssertionError("토큰이 다르면 SweepError가 발생해야 합니다.")
+        try:
+            await SweepCoordinator(addresses).run(inputs)
+        except SweepError:
+            pass
+        else:
+            raise AssertionError("토큰이 없으면 SweepError가 발생해야 합니다.")
+        return await SweepCoordinator(addresses, token="s3cret").run(inputs)
+
+    outputs = asyncio.run(_with_workers(2, body, spawn))
+    assert len(outputs) == len(inputs)
+
+
+def test_unreachable_workers_raise_sweep_error():
+    async def body():
+        coordinator = SweepCoordinator([("127.0.0.1", 1)], unit_timeout=1.0)
+        await coordinator.run(_sweep_inputs(4))
+
+    try:
+        asyncio.run(body())
+    except SweepUnitError:
+        raise AssertionError("워커 손실은 SweepUnitError가 아니어야 합니다.")
+    except SweepError:
+        pass
+    else:
+        raise AssertionError("SweepError가 발생해야 합니다.")
@@ -0,0 +1,64 @@
+"""전력/에너지 모델 테스트.
+
+실행: python -m pytest -q test_energy.py
+"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from prompters import evaluation  # noqa: E402
+from prompters.energy import energy_coefficients, estimate_energy, estimate_energy_batch  # noqa: E402
+from prompters.feedback import generate_cpu_feedback  # noqa: E402
+from prompters.routes import _build_cpu_input_from_params  # noqa: E402
+
+
+def test_larger_or_more_associative_cache_costs_more_per_access():
+    base = energy_coefficients(_build_cpu_input_from_params({"l3_size": "8MB"}))
+    larger = energy_coefficients(_build_cpu_input_from_params({"l3_size": "8MB", "l2_size": "1MB"}))
+    wider = energy_coefficients(_build_cpu_input_from_params({"l3_size": "8MB", "l2_associativity": 16}))
+    assert larger.l2_per_access > base.l2_per_access
+    assert wider.l2_per_access > base.l2_per_access
+    # 다른 레벨의 계수는 그대로
+    assert larger.l1_per_access == base.l1_per_access
+    assert wider.l3_per_access == base.l3_per_access
+
+
+def test_edp_is_energy_times_delay():
+    for params in ({"l3_size": "8MB"}, {"number_of_cores": 8, "clock_frequency": 2.0}, {}):
+        output = evaluation._run_cpu(_build_cpu_input_from_params(params), None)
+        assert math.isclose(output.edp, output.total_energy * output.total_execution_time, rel_tol=1e-12)
+        breakdown = output.energy_breakdown
+        total = breakdown.core_dynamic + breakdown.cache_dynamic + breakdown.dram + breakdown.bus + breakdown.leakage
+        assert math.isclose(output.total_energy, total, rel_tol=1e-12)
+
+
+def test_batch_matches_single_row_estimates():
+    inputs = [
+        _build_cpu_input_from_params({
+            "number_of_cores": 1 + i % 8,
+            "clock_frequency": 1.0 + (i % 5) * 0.5,
+            "l1_size": ["16KB", "32KB", "64KB"][i % 3],
+            "l3_size": "8MB" if i % 2 else None,
+        })
+        for i in range(30)
+    ]
+    activities = [evaluation._simulate_cpu(params)[1] for params in inputs]
+    batch = estimate_energy_batch(inputs, activities)
+    single = [
+        estimate_energy(energy_coefficients(params), activity)
+        for params, activity in zip(inputs, activities)
+    ]
+    assert [b.model_dump() for b in batch] == [s.model_dump() for s in single]
+
+
+def test_cpu_feedback_renders_without_l3():
+    cpu_input = _build_cpu_input_from_params({})
+    assert cpu_input.l3_cache_config is None
+    output = evaluation._run_cpu(cpu_input, None)
+    assert output.l3_hit_rate is None
+    feedback = generate_cpu_feedback(output)
+    assert "**L3 적중률**: 미설정" in feedback
+    assert "에너지 분해" in feedback
@@ -0,0 +1,112 @@
+"""요청 프로파일링 테스트 (서버 없이 앱을 직접 호출).
+
+실행: python -m pytest -q test_profiling.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from main import app  # noqa: E402
+from settings import settings  # noqa: E402
+from prompters import evaluation, routes  # noqa: E402
+from prompters.admission import RateLimiter  # noqa: E402
+
+URL = "/api/v1/simulate/"
+ADMIN_TOKEN = "test-admin-token"
+
+
+def _cpu_payload(profile: bool = True) -> dict:
+    cpu_input = routes._build_cpu_input_from_params({"l3_size": "8MB"})
+    return {
+        "simulator_type": "cpu_architecture",
+        "user_message": "테스트",
+        "cpu_input": cpu_input.model_dump(mode="json"),
+        "profile": profile,
+    }
+
+
+def _busy_run_cpu(input_params, sampling):
+    """샘플러가 스택을 채집할 수 있도록 잠시 CPU를 사용하는 엔진."""
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        pass
+    return _original_run_cpu(input_params, sampling)
+
+
+_original_run_cpu = evaluation._run_cpu
+
+
+def _request(method: str, url: str, headers=None, **kwargs):
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, url, headers=headers, **kwargs)
+    return asyncio.run(send())
+
+
+class _ProfilingSettings:
+    """debug를 끄고 관리자 토큰을 설정한 상태로 테스트합니다."""
+
+    def __enter__(self) -> None:
+        self._previous = settings.debug, settings.admin_token
+        settings.debug, settings.admin_token = False, ADMIN_TOKEN
+        routes.rate_limiter = RateLimiter(1000, 1000)
+        evaluation._run_cpu = _busy_run_cpu
+
+    def __exit__(self, *exc) -> None:
+        settings.debug, settings.admin_token = self._previous
+        evaluation._run_cpu = _original_run_cpu
+
+
+def test_profiling_requires_admin_token():
+    with _ProfilingSettings():
+        assert _request("POST", URL, json=_cpu_payload()).status_code == 403
+        wrong = {"X-Admin-Token": "wrong"}
+        assert _request("POST", URL, json=_cpu_payload(), headers=wrong).status_code == 403
+        # 프로파일링하지 않는 요청은 토큰 없이도 허용
+        assert _request("POST", URL, json=_cpu_payload(profile=False)).status_code == 200
+
+
+def test_profile_summary_and_downloads():
+    headers = {"X-Admin-Token": ADMIN_TOKEN}
+    with _ProfilingSettings():
+        response = _request("POST", URL, json=_cpu_payload(), headers=headers)
+        assert response.status_code == 200
+        profile = response.json()["profile"]
+        assert [stage["name"] for stage in profile["stages"]] == [
+            "extract_parameters", "build_input", "simulate", "feedback",
+        ]
+        simulate = profile["stages"][2]
+        assert simulate["wall_ms"] >= 100
+        # 스레드 풀에서 실행된 엔진의 CPU 시간이 simulate 단계에 포함됨
+        assert simulate["cpu_ms"] >= 50
+        assert profile["sample_count"] > 0
+
+        url = profile["download_url"]
+        assert _request("GET", url).status_code == 403
+
+        speedscope = _request("GET", url, headers=headers)
+        assert speedscope.status_code == 200
+        assert speedscope.headers["content-disposition"].endswith('.speedscope.json"')
+        document = speedscope.json()
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        assert any(name.startswith("_busy_run_cpu ") for name in frames)
+        [sampled] = document["profiles"]
+        assert sampled["type"] == "sampled"
+        assert len(sampled["samples"]) == len(sampled["weights"])
+
+        collapsed = _request("GET", url, headers=headers, params={"format": "collapsed"})
+        assert collapsed.status_code == 200
+        assert collapsed.headers["content-disposition"].endswith('.collapsed.txt"')
+        lines = collapsed.text.splitlines()
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profile["sample_count"]
+        assert any("_busy_run_cpu" in line for line in lines)
+
+        assert _request("GET", url, headers=headers, params={"format": "pprof"}).status_code == 400
+        assert _request("GET", f"{URL}profiles/unknown", headers=headers).status_code == 404
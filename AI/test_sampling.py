@@ -0,0 +1,101 @@
+"""표본 기반 실행 테스트.
+
+실행: python -m pytest -q test_sampling.py
+"""
+
+import asyncio
+import os
+import random
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from main import app  # noqa: E402
+from prompters import routes, sampling  # noqa: E402
+from prompters.admission import RateLimiter  # noqa: E402
+from prompters.feedback import generate_cpu_feedback  # noqa: E402
+from prompters.routes import _build_cpu_input_from_params  # noqa: E402
+from prompters.evaluation import _run_cpu  # noqa: E402
+from prompters.sampling import bernoulli_summary, binomial, run_sampling  # noqa: E402
+from prompters.schemas import SamplingConfig  # noqa: E402
+
+
+def _draw(rng: random.Random, n: int):
+    return {"rate": bernoulli_summary(binomial(rng, n, 0.3), n)}
+
+
+def test_target_met_when_converged():
+    config = SamplingConfig(target_half_width=0.5, batch_size=1000, max_samples=10_000_000, seed=1)
+    intervals = run_sampling(config, _draw, default_metric="rate")
+    assert intervals["rate"].target_met is True
+    assert intervals["rate"].half_width <= 0.5
+    assert intervals["rate"].samples < 10_000_000
+
+
+def test_target_missed_when_max_samples_reached():
+    config = SamplingConfig(target_half_width=0.01, batch_size=1000, max_samples=10_000, seed=1)
+    intervals = run_sampling(config, _draw, default_metric="rate")
+    assert intervals["rate"].target_met is False
+    assert intervals["rate"].samples == 10_000
+
+
+def test_target_met_is_unset_without_target():
+    config = SamplingConfig(batch_size=1000, max_samples=10_000, seed=1)
+    assert run_sampling(config, _draw, default_metric="rate")["rate"].target_met is None
+
+
+def test_batch_count_is_bounded():
+    calls = 0
+
+    def draw(rng, n):
+        nonlocal calls
+        calls += 1
+        return _draw(rng, n)
+
+    config = SamplingConfig(batch_size=100, max_samples=100_000_000, seed=1)
+    intervals = run_sampling(config, draw, default_metric="rate")
+    assert calls <= sampling.MAX_SAMPLING_BATCHES
+    assert intervals["rate"].samples == 100_000_000
+
+
+def test_feedback_reports_missed_target():
+    cpu_input = _build_cpu_input_from_params({"l3_size": "8MB"})
+    config = SamplingConfig(
+        target_metric="l3_hit_rate", target_half_width=0.5, batch_size=100, max_samples=1000, seed=1
+    )
+    output = _run_cpu(cpu_input, config)
+    assert output.confidence_intervals["l3_hit_rate"].target_met is False
+    assert "미달" in generate_cpu_feedback(output)
+
+
+def test_metrics_with_fewer_than_two_samples_are_omitted():
+    config = SamplingConfig(batch_size=100, max_samples=100, seed=2)
+    intervals = _run_cpu(_build_cpu_input_from_params({"l3_size": "8MB"}), config).confidence_intervals
+    assert "l1_hit_rate" in intervals
+    assert "l3_hit_rate" not in intervals
+    assert all(ci.samples >= 2 for ci in intervals.values())
+
+
+def test_small_sample_endpoint_response_is_json():
+    """샘플이 적은 지표가 있어도 응답이 유효한 JSON이어야 합니다 (무한대 값 없음)."""
+    routes.rate_limiter = RateLimiter(1000, 1000)
+    cpu_input = _build_cpu_input_from_params({"l3_size": "8MB"})
+    payload = {
+        "simulator_type": "cpu_architecture",
+        "user_message": "테스트",
+        "cpu_input": cpu_input.model_dump(mode="json"),
+        "sampling": {"batch_size": 100, "max_samples": 100, "seed": 2},
+    }
+
+    async def post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/v1/simulate/", json=payload)
+
+    response = asyncio.run(post())
+    assert response.status_code == 200
+    intervals = response.json()["cpu_output"]["confidence_intervals"]
+    assert "l3_hit_rate" not in intervals
+    assert intervals["l1_hit_rate"]["upper"] > intervals["l1_hit_rate"]["lower"]
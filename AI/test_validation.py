@@ -0,0 +1,85 @@
+"""스윕 일괄 검증 테스트.
+
+실행: python -m pytest -q test_validation.py
+"""
+
+import os
+import sys
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from prompters.routes import _build_cpu_input_from_params  # noqa: E402
+from prompters.schemas import CPUArchitectureInput  # noqa: E402
+from prompters.validation import SweepValidationError, _compile, validate_cpu_rows  # noqa: E402
+
+
+def _expect_type_error(model) -> str:
+    try:
+        _compile(model)
+    except TypeError as e:
+        return str(e)
+    raise AssertionError(f"{model.__name__}는 컴파일되지 않아야 합니다.")
+
+
+def test_unsupported_constraints_fail_at_compile_time():
+    class Positive(BaseModel):
+        x: int = Field(..., gt=0)
+
+    class Stepped(BaseModel):
+        x: float = Field(..., ge=0, multiple_of=0.5)
+
+    class Validated(BaseModel):
+        x: int = Field(..., ge=0)
+
+        @field_validator("x")
+        @classmethod
+        def check_x(cls, x):
+            return x
+
+    assert "Positive.x" in _expect_type_error(Positive)
+    assert "Stepped.x" in _expect_type_error(Stepped)
+    assert "check_x" in _expect_type_error(Validated)
+
+
+def test_bulk_path_agrees_with_model_validate():
+    base = _build_cpu_input_from_params({"l3_size": "8MB"}).model_dump(mode="json")
+    rows = [
+        base,
+        {**base, "issue_width": 0},
+        {**base, "clock_frequency": "3.5"},
+        {**base, "clock_frequency": float("nan")},
+        {**base, "clock_frequency": "nan"},
+        {**base, "bus_bandwidth": float("inf")},
+        {**base, "issue_width": "4.0"},
+        {**base, "issue_width": " 4 "},
+        {**base, "issue_width": "4.5"},
+        {**base, "issue_width": True},
+        {**base, "clock_frequency": True},
+        {**base, "rob_size": 1024},
+        {**base, "prefetcher_type": "unknown"},
+        {**base, "l1_cache_config": {**base["l1_cache_config"], "size": "48KB"}},
+        {**base, "l3_cache_config": None},
+    ]
+    for row in rows:
+        try:
+            expected = CPUArchitectureInput.model_validate(row)
+        except ValidationError:
+            expected = None
+        try:
+            [actual] = validate_cpu_rows([row])
+        except SweepValidationError:
+            actual = None
+        assert (expected is None) == (actual is None), row
+        if expected is not None:
+            assert actual.model_dump() == expected.model_dump()
+
+
+def test_normalized_follows_model_copy():
+    cpu_input = _build_cpu_input_from_params({"l1_size": "32KB"})
+    l1 = cpu_input.l1_cache_config
+    assert l1.normalized.size_bytes == 32 * 1024
+    resized = l1.model_copy(update={"size": "64KB"})
+    assert resized.normalized.size_bytes == 64 * 1024
+    assert l1.normalized.size_bytes == 32 * 1024